@@ -0,0 +1,12 @@
+"""
+Launches the comic library with ``python -m my_project``.
+
+Tagging workers are started with the spawn method, which skips re-importing a
+package's ``__main__`` module. Launching from here keeps the workers from
+importing Qt and the rest of the GUI.
+"""
+
+if __name__ == "__main__":
+    from my_project.main import main
+
+    main()
@@ -6,12 +6,6 @@ from typing import Optional
 from my_project.classes.helper_classes import ComicInfo
 from my_project.utils.file_utils import normalise_publisher_name
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 SHARED_ALIASES = [
     "Robin",
     "Green Lantern",
@@ -44,14 +38,34 @@ SHARED_ALIASES = [
 
 
 class MetadataInputting:
-    def __init__(self, comicinfo: ComicInfo, page_count: int) -> None:
+    def __init__(
+        self,
+        comicinfo: ComicInfo,
+        page_count: int,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> None:
         self.clean_info = comicinfo
         self.clean_dict = comicinfo.model_dump()
         self.clean_dict["pages"] = page_count
         self.comic_id = comicinfo.primary_key
-        self.conn = sqlite3.connect("comics.db")
+        # A connection that is passed in belongs to the caller, which commits it.
+        self.owns_conn = conn is None
+        self.conn = conn if conn is not None else sqlite3.connect("comics.db")
         self.cursor = self.conn.cursor()
 
+    def commit(self) -> None:
+        """
+        Commits the inputter's own connection. A shared connection is left for its
+        owner to commit, so several comics can be written in one transaction.
+        """
+        if self.owns_conn:
+            self.conn.commit()
+
+    def close(self) -> None:
+        """Closes the inputter's own connection, leaving a shared one open."""
+        if self.owns_conn:
+            self.conn.close()
+
     def dict_into_main_db_table(self) -> None:
         self.cursor.execute(
             """
@@ -62,7 +76,32 @@ class MetadataInputting:
             """,
             self.clean_dict,
         )
-        self.conn.commit()
+
+    def insert_names(self, table: str, column: str, names: list[str]) -> dict[str, int]:
+        """
+        Inserts any names that are not already in a lookup table and fetches the
+        IDs of all of them, with one batched insert and one select.
+
+        Args:
+            table (str): The lookup table, e.g. characters.
+            column (str): The unique name column of that table.
+            names (list[str]): The names to insert or find.
+
+        Returns:
+            dict[str, int]: The ID of each name.
+        """
+        if not names:
+            return {}
+        self.cursor.executemany(
+            f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)",  # nosec B608
+            [(name,) for name in names],
+        )
+        placeholders = ", ".join("?" * len(names))
+        self.cursor.execute(
+            f"SELECT {column}, id FROM {table} WHERE {column} IN ({placeholders})",  # nosec B608
+            names,
+        )
+        return {name: int(row_id) for name, row_id in self.cursor.fetchall()}
 
     # =====================
     # Character Insertion
@@ -74,22 +113,15 @@ class MetadataInputting:
         return None  # Unknown identity
 
     def insert_or_find_character(self) -> list[tuple[str, int]]:
-        character_ids = []
         if self.clean_info.characters is None:
             raise ValueError("characters cannot be empty")
-        for character in self.clean_info.characters:
-            # identity_info = self.find_identity(character)
-            self.cursor.execute(
-                "INSERT OR IGNORE INTO characters (name) VALUES (?)", (character,)
-            )
-            self.cursor.execute(
-                "SELECT id FROM characters WHERE name = ?", (character,)
-            )
-            row = self.cursor.fetchone()
-            if row:
-                character_ids.append((character, int(row[0])))
-        self.conn.commit()
-        return character_ids
+        # identity_info = self.find_identity(character)
+        ids = self.insert_names("characters", "name", self.clean_info.characters)
+        return [
+            (character, ids[character])
+            for character in self.clean_info.characters
+            if character in ids
+        ]
 
     def insert_into_comic_characters(
         self,
@@ -100,79 +132,49 @@ class MetadataInputting:
             ]
         ],
     ) -> None:
-        for character in characters:
-            _, character_id = character
-            # identity_id = identity_info[1] if identity_info else None
-            self.cursor.execute(
-                """
-                INSERT INTO comic_characters
-                (comic_id, character_id)
-                VALUES
-                (?, ?)
-                """,
-                (
-                    self.comic_id,
-                    character_id,
-                ),
-            )
-        self.conn.commit()
+        # identity_id = identity_info[1] if identity_info else None
+        self.cursor.executemany(
+            """
+            INSERT INTO comic_characters
+            (comic_id, character_id)
+            VALUES
+            (?, ?)
+            """,
+            [(self.comic_id, character_id) for _, character_id in characters],
+        )
 
     # ==================
     # Teams Insertion
     # ==================
 
     def insert_new_teams(self) -> list[tuple[str, int]]:
-        teams_ids = []
         if self.clean_info.teams is None:
             raise ValueError("teams cannot be None")
-        for team in self.clean_info.teams:
-            self.cursor.execute(
-                "INSERT OR IGNORE INTO teams (name) VALUES (?)", (team,)
-            )
-            self.cursor.execute("SELECT id FROM teams WHERE name = ?", (team,))
-            row = self.cursor.fetchone()
-            if row:
-                teams_ids.append((team, row[0]))
-        self.conn.commit()
-        return teams_ids
+        ids = self.insert_names("teams", "name", self.clean_info.teams)
+        return [(team, ids[team]) for team in self.clean_info.teams if team in ids]
 
     def insert_into_comic_teams(self, teams: list[tuple[str, int]]):
-        for team in teams:
-            self.cursor.execute(
-                """
-                INSERT INTO comic_teams
-                (comic_id, team_id)
-                VALUES
-                (?, ?)
-                """,
-                (
-                    self.comic_id,
-                    team[1],
-                ),
-            )
-        self.conn.commit()
+        self.cursor.executemany(
+            """
+            INSERT INTO comic_teams
+            (comic_id, team_id)
+            VALUES
+            (?, ?)
+            """,
+            [(self.comic_id, team_id) for _, team_id in teams],
+        )
 
     # ====================
     # Creator Insertion
     # ====================
 
     def insert_new_creators(self) -> list[tuple[str, int]]:
-        creators_ids = []
-        if self.clean_info.creators is not None:
-            for entry in self.clean_info.creators:
-                name, _ = entry
-                self.cursor.execute(
-                    "INSERT OR IGNORE INTO creators (real_name) VALUES (?)", (name,)
-                )
-
-                self.cursor.execute(
-                    "SELECT id from creators WHERE real_name = ?", (name,)
-                )
-                row = self.cursor.fetchone()
-                if row:
-                    creators_ids.append((name, row[0]))
-        self.conn.commit()
-        return creators_ids
+        if self.clean_info.creators is None:
+            return []
+        names = [name for name, _ in self.clean_info.creators]
+        ids = self.insert_names("creators", "real_name", names)
+        # One entry per (name, role) pair, in order, for insert_into_comic_creators.
+        return [(name, ids[name]) for name in names if name in ids]
 
     def get_role_ids(self) -> dict[str, int]:
         self.cursor.execute("SELECT id, role_name FROM roles")
@@ -186,23 +188,19 @@ class MetadataInputting:
         if creator_role_pairs is not None:
             for index, info in enumerate(creators):
                 creator_role_id_tuples.append(creator_role_pairs[index] + (info[1],))
-        print(creator_role_id_tuples)
-        for entry in creator_role_id_tuples:
-            _, role, id = entry
-            if role in roles.keys():
-                role_id = roles[role]
-            else:
-                role_id = 0
-            self.cursor.execute(
-                """
-                INSERT INTO comic_creators
-                (comic_id, creator_id, role_id)
-                VALUES
-                (?, ?, ?)
-                """,
-                (self.comic_id, id, role_id),
-            )
-        self.conn.commit()
+        logging.debug("Creator role tuples: %s", creator_role_id_tuples)
+        self.cursor.executemany(
+            """
+            INSERT INTO comic_creators
+            (comic_id, creator_id, role_id)
+            VALUES
+            (?, ?, ?)
+            """,
+            [
+                (self.comic_id, creator_id, roles.get(role, 0))
+                for _, role, creator_id in creator_role_id_tuples
+            ],
+        )
 
     def flatten_data(self) -> dict[str, str]:
         if self.clean_info.characters is None:
@@ -232,6 +230,11 @@ class MetadataInputting:
     # ==============
 
     def run(self):
+        """
+        Writes the comic and its characters, teams and creators. Nothing is
+        committed here so the caller can commit them, and anything else written
+        for the comic, as one transaction.
+        """
         self.dict_into_main_db_table()
         character_info = self.insert_or_find_character()
         self.insert_into_comic_characters(character_info)
@@ -239,10 +242,9 @@ class MetadataInputting:
         self.insert_into_comic_teams(team_info)
         creator_info = self.insert_new_creators()
         self.insert_into_comic_creators(creator_info)
-        self.conn.commit()
 
     def insert_filepath(self, filepath: Path):
-        logging.debug(f"Updating comic ID {self.comic_id} with path {filepath.name}")
+        logging.debug("Updating comic ID %s with path %s", self.comic_id, filepath.name)
         self.cursor.execute(
             """
             UPDATE comics
@@ -252,13 +254,17 @@ class MetadataInputting:
             (str(filepath), self.comic_id),
         )
         logging.info("SQL executed successfully.")
-        logging.debug(f"Rows updated: {self.cursor.rowcount}")
-        self.conn.commit()
+        logging.debug("Rows updated: %s", self.cursor.rowcount)
+        self.commit()
 
 
-def insert_new_publisher(publisher_name: str) -> None:
+def insert_new_publisher(
+    publisher_name: str, conn: Optional[sqlite3.Connection] = None
+) -> None:
     normalised_name = normalise_publisher_name(publisher_name)
-    conn = sqlite3.connect("comics.db")
+    owns_conn = conn is None
+    if conn is None:
+        conn = sqlite3.connect("comics.db")
     cursor = conn.cursor()
 
     cursor.execute(
@@ -269,4 +275,6 @@ def insert_new_publisher(publisher_name: str) -> None:
         ),
     )
 
-    conn.commit()
+    if owns_conn:
+        conn.commit()
+        conn.close()
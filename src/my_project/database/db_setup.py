@@ -35,6 +35,11 @@ def create_tables(db_path: Path | str) -> None:
     # Add later:
     # FOREIGN KEY (series) REFERENCES series(id)
 
+    # Comics are looked up by path when sweeping the library for new files.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_comics_file_path ON comics (file_path)"
+    )
+
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS publishers (
@@ -1,11 +1,40 @@
+import atexit
 import sqlite3
+import threading
 
+_thread_local = threading.local()
 
-def get_publisher_info() -> list[tuple[int, str, str]]:
-    conn = sqlite3.connect("comics.db")
-    cursor = conn.cursor()
 
-    cursor.execute("SELECT id, name, normalised_name FROM publishers")
-    results = cursor.fetchall()
-    conn.close()
-    return results
+def get_connection() -> sqlite3.Connection:
+    """
+    Returns a connection to the comics database that is reused for the
+    lifetime of the calling thread.
+
+    The pragmas are applied once when the connection is first opened: WAL so
+    readers are not blocked while the tagger is writing, plus an in-memory temp
+    store, a memory-mapped database file and a 64 MiB page cache so repeated
+    lookups stay warm. The connection is closed when the interpreter exits.
+
+    Returns:
+        sqlite3.Connection: The calling thread's shared connection.
+    """
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        # Only the owning thread uses it; the flag lets atexit close it.
+        conn = sqlite3.connect("comics.db", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        atexit.register(conn.close)
+        _thread_local.conn = conn
+    return conn
+
+
+def get_publisher_info() -> list[tuple[int, str, str]]:
+    return (
+        get_connection()
+        .execute("SELECT id, name, normalised_name FROM publishers")
+        .fetchall()
+    )
@@ -35,15 +35,29 @@ class RepoWorker:
         Enters the context manager by connecting to the database and initialising the
         context manager.
         """
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exits the context manager by saving the changes to the database and closing the connection"""
+        self.close()
+        return
+
+    def open(self) -> "RepoWorker":
+        """
+        Connects to the database, for a worker that is kept open longer than a
+        single with block. Pair it with close.
+
+        Returns:
+            RepoWorker: This worker, now connected.
+        """
         self.conn = sqlite3.connect(DB_PATH)
         self.cursor = self.conn.cursor()
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exits the context manager by saving the changes to the database and closing the connection"""
+    def close(self) -> None:
+        """Saves the changes to the database and closes the connection."""
         self.conn.commit()
         self.conn.close()
-        return
 
     def create_basemodel(self, ids: list[str], **thumb: bool) -> list[GUIComicInfo]:
         """
@@ -124,6 +138,18 @@ class RepoWorker:
         )
         return True if self.cursor.fetchone() else False
 
+    def known_paths(self) -> set[str]:
+        """
+        Gets the filepath of every comic in the database in one query, so many
+        files can be checked without a query each.
+
+        Returns:
+            set[str]: The filepaths, relative to the root directory, as stored
+                in the database.
+        """
+        self.cursor.execute("SELECT file_path FROM comics WHERE file_path IS NOT NULL")
+        return {row[0] for row in self.cursor.fetchall()}
+
     def run(self) -> tuple[list[GUIComicInfo], list[float], list[GUIComicInfo]]:
         """
         Goes through the database and finds comics that are partially read, or require reviewing.
@@ -5,6 +5,7 @@ A file containing functions that add to the fts5 database and query it.
 import os
 import sqlite3
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -87,15 +88,21 @@ def get_and_flatten_data(comic_id: str) -> dict[str, str]:
     }
 
 
-def insert_into_fts5(cleaned_data: dict[str, str]) -> None:
+def insert_into_fts5(
+    cleaned_data: dict[str, str], conn: Optional[sqlite3.Connection] = None
+) -> None:
     """
     Takes comic metadata and inserts it into a fast search database.
 
     Args:
         cleaned_data (dict[str, str]): A dictionary containing the information required
             for the fast search database. Includes: id, series, title, creators, characters and teams.
+        conn (Optional[sqlite3.Connection]): A connection to write with, which the
+            caller commits. If None a new connection is opened and committed.
     """
-    conn = sqlite3.connect(DB_PATH)
+    owns_conn = conn is None
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     cursor.execute(
         """
@@ -105,8 +112,9 @@ def insert_into_fts5(cleaned_data: dict[str, str]) -> None:
         """,
         cleaned_data,
     )
-    conn.commit()
-    conn.close()
+    if owns_conn:
+        conn.commit()
+        conn.close()
 
 
 def text_search(text: str) -> list[GUIComicInfo] | None:
@@ -10,6 +10,7 @@ from typing import Optional
 import uvicorn
 from dotenv import load_dotenv
 from PySide6.QtCore import QTimer
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -49,24 +50,14 @@ from my_project.ui.widgets.reading_order_widget import (
 )
 from my_project.ui.widgets.settings_widget import Settings
 from my_project.utils.cleanup import scan_and_clean
+from my_project.utils.logging_setup import configure_logging
 
 load_dotenv()
 root_string = os.getenv("ROOT_DIR")
 ROOT_DIR = Path(root_string if root_string is not None else "")
 DB_PATH = Path(os.getenv("DB_PATH") or "comics.db")
-print(ROOT_DIR)
-print(DB_PATH)
-log_file = open("debug.log", "w", encoding="utf-8")
-sys.stdout = log_file
-sys.stderr = log_file
-
 logging.getLogger("asyncio").setLevel(logging.WARNING)
 logging.getLogger("qasync").setLevel(logging.WARNING)
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 
 
 class HomePage(QMainWindow):
@@ -482,16 +473,26 @@ def count_files_and_storage(directory: str) -> tuple[int, float]:
 
     Recursively walks through the directory structure, counting all files
     (excluding symbolic links) and calculating the total size in bytes. This
-    is then converted to gigabytes.
+    is then converted to gigabytes. Entry types come from os.scandir, so only
+    the files themselves are stat'ed.
     """
     total_size = 0.0
     file_count = 0
-    for dirpath, _, filenames in os.walk(directory):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if not os.path.islink(fp):
-                file_count += 1
-                total_size += os.path.getsize(fp)
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    file_count += 1
+                    total_size += entry.stat(follow_symlinks=False).st_size
     total_size = total_size / (1024**3)
     return file_count, total_size
 
@@ -500,13 +501,28 @@ def start_api():
     uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """
+    Starts the API server and the GUI, sending console output to debug.log.
+
+    This runs only in the GUI process. Spawned tagging workers import the main
+    module again, so it must not truncate the log or redirect output on import.
+    """
+    print(ROOT_DIR)
+    print(DB_PATH)
+    log_file = open("debug.log", "w", encoding="utf-8")
+    sys.stdout = log_file
+    sys.stderr = log_file
+
+    configure_logging()
     # scan_and_clean()
     startup_checks()
     api_thread = threading.Thread(target=start_api, daemon=True)
     api_thread.start()
 
     qt_app = QApplication(sys.argv)
+    # Room for the cover thumbnails shown by metadata dialogs, in KB.
+    QPixmapCache.setCacheLimit(32 * 1024)
 
     loop = QEventLoop(qt_app)
     asyncio.set_event_loop(loop)
@@ -517,3 +533,7 @@ if __name__ == "__main__":
 
     with loop:
         loop.run_forever()
+
+
+if __name__ == "__main__":
+    main()
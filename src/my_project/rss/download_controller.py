@@ -19,12 +19,6 @@ load_dotenv()
 root_folder = os.getenv("ROOT_DIR") or ""
 ROOT_DIR = Path(root_folder)
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class DownloadControllerAsync:
     """
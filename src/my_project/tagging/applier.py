@@ -1,4 +1,3 @@
-import logging
 from datetime import datetime
 from pathlib import Path
 
@@ -11,12 +10,6 @@ from my_project.classes.helper_classes import (
     TeamInfo,
 )
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class TagApplication:
     def __init__(
@@ -6,12 +6,6 @@ from typing import TypedDict, cast
 from my_project.classes.helper_classes import ComicVineIssueStruct
 from my_project.tagging.requester import RequestData
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class ComicMatch(TypedDict):
     title: str
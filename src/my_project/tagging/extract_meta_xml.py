@@ -2,24 +2,58 @@ import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from xml.etree.ElementTree import Element  # type: ignore
-
-from defusedxml import ElementTree as ET
+from xml.etree.ElementTree import Element, ParseError  # type: ignore
 
 from my_project.classes.helper_classes import ComicInfo
 
 
+def parse_comicinfo(data: bytes) -> Element:
+    """
+    Parses the raw bytes of a ComicInfo.xml file.
+
+    Uses lxml when it is installed, with entity resolution and network access
+    turned off, and falls back to defusedxml otherwise.
+
+    Args:
+        data (bytes): The contents of ComicInfo.xml.
+
+    Returns:
+        Element: The root of the parsed XML tree.
+
+    Raises:
+        ParseError: If the data is not valid XML.
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        from defusedxml import ElementTree as ET
+
+        return ET.fromstring(data)
+
+    parser = etree.XMLParser(
+        resolve_entities=False, no_network=True, remove_blank_text=True
+    )
+    try:
+        return etree.fromstring(data, parser)  # type: ignore[return-value]
+    except etree.XMLSyntaxError as e:
+        raise ParseError(str(e)) from e
+
+
 class MetadataExtraction:
-    def __init__(self, comic_info: ComicInfo) -> None:
+    def __init__(
+        self, comic_info: ComicInfo, metadata_root: Element | None = None
+    ) -> None:
         self.comic_info = comic_info
         self.filepath: Path = comic_info.filepath
         self.temp_dir: Path = Path(tempfile.mkdtemp())
         self.extracted: bool = False
-        self.metadata_root: Element | None = None
+        self.metadata_root: Element | None = metadata_root
+        self._fields: dict[str, str | None] | None = None
 
     def __enter__(self):
-        self.extract()
-        self.get_metadata()
+        if self.metadata_root is None:
+            self.extract()
+            self.get_metadata()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -39,7 +73,7 @@ class MetadataExtraction:
             zipfile.BadZipFile: If the file is not a valid ZIP archive.
             FileNotFoundError: If the file is not found.
             KeyError: If ComicInfo.xml is not found in the archive.
-            ET.ParseError: If ComicInfo.xml is not valid XML.
+            ParseError: If ComicInfo.xml is not valid XML.
             Any other exceptions encountered during file access/parsing.
         """
         # self.extract()
@@ -47,8 +81,7 @@ class MetadataExtraction:
             return
         xml_path = self.temp_dir / "ComicInfo.xml"
         if xml_path.exists():
-            tree = ET.parse(xml_path)
-            self.metadata_root = tree.getroot()
+            self.metadata_root = parse_comicinfo(xml_path.read_bytes())
 
     def get_text(self, tag: str) -> str:
         """
@@ -65,9 +98,15 @@ class MetadataExtraction:
         """
         if self.metadata_root is None:
             raise ValueError("metadata_root has not been intialised.")
-        element = self.metadata_root.find(tag)
-        if element is not None and element.text:
-            return element.text.strip()
+        if self._fields is None:
+            # Index the top-level tags in one pass instead of a find() per field.
+            # The first occurrence wins, as it does with find().
+            self._fields = {}
+            for child in self.metadata_root:
+                self._fields.setdefault(child.tag, child.text)
+        text = self._fields.get(tag)
+        if text:
+            return text.strip()
         else:
             if tag in [
                 "Editor",
@@ -1,21 +1,12 @@
-import calendar
+import functools
 import logging
 import re
-import traceback
-
-from fuzzywuzzy import fuzz  # type: ignore[import-untyped]
-from word2number import w2n  # type: ignore[import-untyped]
+from typing import Optional
 
 from my_project.classes.helper_classes import ComicInfo
 from my_project.database.db_utils import get_publisher_info
 from my_project.utils.file_utils import normalise_publisher_name
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 SERIES_OVERRIDES = [
     ("tpb", 1, "TPB"),
     ("omnibus", 2, "Omni"),
@@ -23,6 +14,115 @@ SERIES_OVERRIDES = [
     ("epic collection", 3, "EC"),
 ]
 
+# All the override keywords in one pattern so each string is only scanned once.
+# Longer keywords come first in SERIES_OVERRIDES so they win over their suffixes.
+SERIES_OVERRIDES_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword, _, _ in SERIES_OVERRIDES)
+)
+
+OVERRIDE_BY_KEYWORD = {
+    keyword: (rank, type_id)
+    for rank, (keyword, type_id, _) in enumerate(SERIES_OVERRIDES)
+}
+
+COLLECTION_BY_ID = {type_id: abbr.strip() for _, type_id, abbr in SERIES_OVERRIDES}
+
+MONTH_ABBR = (
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+_WORD_NUM = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_publishers() -> tuple[
+    tuple[int, ...], tuple[str, ...], list[str], dict[str, tuple[int, str]]
+]:
+    """
+    Loads the known publishers from the database once and keeps them in memory.
+
+    Call `clear_publisher_cache()` after inserting a new publisher.
+
+    Returns:
+        tuple: Parallel (ids, display_names, clean_names) for every known publisher,
+            plus an index from clean_name to (id, display_name) for exact matches.
+    """
+    known_publishers = get_publisher_info()
+    ids = tuple(pub_id for pub_id, _, _ in known_publishers)
+    display_names = tuple(pub_name for _, pub_name, _ in known_publishers)
+    clean_names = [clean_name for _, _, clean_name in known_publishers]
+    exact_index = {
+        clean_name: (pub_id, pub_name)
+        for pub_id, pub_name, clean_name in known_publishers
+    }
+    return ids, display_names, clean_names, exact_index
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_normalised_publisher(normalised_pub_name: str) -> Optional[tuple[int, str]]:
+    """
+    Finds the known publisher closest to an already normalised publisher name.
+
+    Results are cached per name, so comics from the same publisher skip the search.
+
+    Args:
+        normalised_pub_name (str): The output of normalise_publisher_name.
+
+    Returns:
+        Optional[tuple[int, str]]: The (id, name) of the match, or None if nothing
+            scored 80 or above.
+    """
+    from rapidfuzz import fuzz, process
+
+    ids, display_names, clean_names, exact_index = _cached_publishers()
+    exact = exact_index.get(normalised_pub_name)
+    if exact is not None:
+        return exact
+
+    # Both sides are already normalised so skip the scorer's own preprocessing.
+    match = process.extractOne(
+        normalised_pub_name,
+        clean_names,
+        scorer=fuzz.token_set_ratio,
+        processor=None,
+        score_cutoff=80,
+    )
+    if match is None:
+        return None
+    index = match[2]
+    return ids[index], display_names[index]
+
+
+def clear_publisher_cache() -> None:
+    """Forgets the cached publishers and matches, e.g. after adding a publisher."""
+    _cached_publishers.cache_clear()
+    _match_normalised_publisher.cache_clear()
+
 
 class PublisherNotKnown(KeyError):
     """An error that is raised when the publisher is not in the database."""
@@ -52,28 +152,55 @@ class MetadataProcessing:
 
     def __enter__(self):
         """Context manager entrance."""
-        logging.info(f"Starting metadata processing for {self.filepath.name}")
+        logging.info("Starting metadata processing for %s", self.filepath.name)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit with messages for success or failure."""
         if exc_type:
-            logging.error(f"Exception while processing {self.filepath.name}: {exc_val}")
-            traceback.print_tb(exc_tb)
+            logging.error(
+                "Exception while processing %s: %s",
+                self.filepath.name,
+                exc_val,
+                exc_info=(exc_type, exc_val, exc_tb),
+            )
         else:
-            logging.info(f"Sucessfully finished processing {self.filepath.name}")
+            logging.info("Sucessfully finished processing %s", self.filepath.name)
         return False
 
-    PATTERNS: list[re.Pattern] = [
-        re.compile(r"\bv(?P<num>)\d{1,3}\b", re.I),
-        re.compile(r"\b(?P<num>\d{3})\b"),
-        re.compile(r"\bvol(?:ume)?\.?\s*(?P<num>\d{1,3})\b", re.I),
-    ]
+    # A marked volume number wins over a bare three-digit number, wherever
+    # each appears in the filename.
+    FILENAME_VOLUME_PATTERN = re.compile(
+        r"\bv(?P<v1>\d{1,3})\b|\bvol(?:ume)?\.?\s*(?P<v2>\d{1,3})\b", re.I
+    )
+
+    FILENAME_NUMBER_PATTERN = re.compile(r"\b(?P<num>\d{3})\b")
 
     SPECIAL_PATTERN = re.compile(r"\bv(?P<volume>\d{1,3})\s+(?P<issue>\d{2,3})\b", re.I)
 
-    @staticmethod
-    def title_case(title: str) -> str:
+    VOLUME_SIGNIFIER_PATTERN = re.compile(r"\b(vol(?:ume)?|book)\b", re.I)
+
+    VOLUME_PATTERN = re.compile(
+        r"(?:vol(?:ume)?|book)\.?\s*"
+        r"(\d+|one|two|three|four|five|six|seven|eight|nine|ten|"
+        r"eleven|twelve)\s*[:\-]?\s*(.*)",
+        re.I,
+    )
+
+    SANITISE_PATTERN = re.compile(r'[<>:"/\\|?*]')
+
+    MINOR_WORDS = "a|an|and|as|at|but|by|for|in|nor|of|on|or|so|the|to|up|yet"
+
+    # The first letter of every word and of every hyphenated part of a word.
+    CAPITALISE_PATTERN = re.compile(r"(?:^|(?<=[ -]))[^\W\d_]")
+
+    # Minor words between two other words, or after a hyphen inside a word.
+    MINOR_WORD_PATTERN = re.compile(
+        rf"(?<= )(?:{MINOR_WORDS})(?= )|(?<=-)(?:{MINOR_WORDS})(?=[- ]|$)", re.I
+    )
+
+    @classmethod
+    def title_case(cls, title: str) -> str:
         """
         Capitalises the first letter of each word in a string.
 
@@ -86,57 +213,9 @@ class MetadataProcessing:
         Returns:
             str: The formatted string with capital letters in the correct place.
         """
-        # Need to also make this capitalise things like X-Men not X-men.
-        minor_words = {
-            "a",
-            "an",
-            "and",
-            "as",
-            "at",
-            "but",
-            "by",
-            "for",
-            "in",
-            "nor",
-            "of",
-            "on",
-            "or",
-            "so",
-            "the",
-            "to",
-            "up",
-            "yet",
-        }
-
-        def smart_cap(word: str) -> str:
-            """Capitalises a word separated by hyphens and no space."""
-            parts = word.split("-")
-            new_parts = []
-            for i, part in enumerate(parts):
-                if part in minor_words and i != 0:
-                    new_parts.append(part)
-                else:
-                    new_parts.append(cap_first_letter(part))
-            return "-".join(new_parts)
-
-        def cap_first_letter(word: str) -> str:
-            """Capitalises the first letter of a word."""
-            if not word:
-                return word
-            return word[0].upper() + word[1:]
-
-        words = title.lower().split()
-        if not words:
-            return ""
-
-        result = []
-        for i, word in enumerate(words):
-            if i == 0 or i == len(words) - 1 or word not in minor_words:
-                result.append(smart_cap(word))
-            else:
-                result.append(word)
-
-        return " ".join(result)
+        lowered = " ".join(title.lower().split())
+        capitalised = cls.CAPITALISE_PATTERN.sub(lambda m: m[0].upper(), lowered)
+        return cls.MINOR_WORD_PATTERN.sub(lambda m: m[0].lower(), capitalised)
 
     def match_publisher(self) -> tuple[int, str]:
         """
@@ -154,21 +233,29 @@ class MetadataProcessing:
         Raises:
             KeyError: If no known publisher matches closely enough.
         """
-        known_publishers = get_publisher_info()
-        best_score = 0
-        best_match = None
         raw_pub_name = self.raw_info.publisher if self.raw_info.publisher else "Marvel"
-        normalised_pub_name = normalise_publisher_name(raw_pub_name)
-        for pub_id, pub_name, clean_name in known_publishers:
-            score = fuzz.token_set_ratio(normalised_pub_name, clean_name)
-            if score > best_score:
-                best_match = (pub_id, pub_name)
-                best_score = score
-        if best_score >= 80 and best_match:
-            return best_match
-        else:
+        match = _match_normalised_publisher(normalise_publisher_name(raw_pub_name))
+        if match is None:
             # TODO: Add the raw_pub_name to the database.
             raise PublisherNotKnown(raw_pub_name)
+        return match
+
+    @staticmethod
+    def is_known_publisher(raw_pub_name: str) -> bool:
+        """
+        Checks whether a publisher name matches a known publisher, using the same
+        cached lookup as match_publisher.
+
+        Args:
+            raw_pub_name: The publisher name extracted from the metadata.
+
+        Returns:
+            bool: True if match_publisher would find the publisher.
+        """
+        return (
+            _match_normalised_publisher(normalise_publisher_name(raw_pub_name))
+            is not None
+        )
 
     def title_parsing(self) -> dict[str, str | int]:
         """
@@ -190,8 +277,39 @@ class MetadataProcessing:
 
         # ! Function rewritten so may have broken.
 
-        title_raw = (self.raw_info.title or "").lower()
-        series_raw = (self.raw_info.series or "").lower()
+        title, series, collection_type, volume_num = self._parse_title(
+            (self.raw_info.title or "").lower(), (self.raw_info.series or "").lower()
+        )
+
+        if volume_num is None:
+            logging.warning("Could not find a good volume number!")
+            # self.title_info["title"] = str(self.raw_info.title)
+            # self.title_info["series"] = str(self.raw_info.series)
+            volume_num = self.raw_info.volume_num or 0
+
+        self.title_info["title"] = title
+        self.title_info["series"] = series
+        self.title_info["collection_type"] = collection_type
+        self.title_info["volume_num"] = volume_num
+        return self.title_info
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_title(
+        cls, title_raw: str, series_raw: str
+    ) -> tuple[str, str, int, Optional[int]]:
+        """
+        The pure part of title_parsing, cached as comics in the same series often
+        share their raw title and series.
+
+        Args:
+            title_raw (str): The lowercased title from the metadata.
+            series_raw (str): The lowercased series name from the metadata.
+
+        Returns:
+            tuple[str, str, int, Optional[int]]: (title, series, collection_type,
+                volume_num), where volume_num is None if the title has none.
+        """
 
         def split_title_and_series(raw_title: str, raw_series: str) -> tuple[str, str]:
             """
@@ -205,21 +323,23 @@ class MetadataProcessing:
                 tuple[str, str]: (series_name, collection_title)
             """
 
-            if ":" in raw_title:
-                preterm, collection_title = map(str.strip, raw_title.split(":", 1))
+            idx = raw_title.find(":")
+            if idx >= 0:
+                preterm = raw_title[:idx].strip()
+                collection_title = raw_title[idx + 1 :].strip()
 
                 if has_volume_signifier(preterm):
                     return raw_series.strip(), collection_title
                 else:
-                    return preterm.strip(), collection_title
+                    return preterm, collection_title
 
             # else:
             #     if has_volume_signifier(raw_title):
             #         return raw_series.strip(), ""
 
-            if ":" in raw_series:
-                series, title = map(str.strip, raw_series.split(":", 1))
-                return series, title
+            idx = raw_series.find(":")
+            if idx >= 0:
+                return raw_series[:idx].strip(), raw_series[idx + 1 :].strip()
 
             return raw_series.strip(), raw_title.strip()
 
@@ -230,8 +350,7 @@ class MetadataProcessing:
             Returns:
                 bool: True if there is one, False otherwise.
             """
-            volume_pattern = re.compile(r"\b(vol(?:ume)?|book)\b", re.I)
-            return bool(volume_pattern.search(term))
+            return bool(cls.VOLUME_SIGNIFIER_PATTERN.search(term))
 
         def normalise_collection_title(collection_title: str, series_name: str) -> str:
             """Chooses whether to use series or title depening on ambiguous words in title."""
@@ -247,13 +366,13 @@ class MetadataProcessing:
             If there is no match then 1 is returned as this signals tpb, the generic type.
             """
 
-            for keyword, type_id, _ in SERIES_OVERRIDES:
-                if (
-                    keyword in series_name.lower()
-                    or keyword in collection_title.lower()
-                ):
-                    return type_id
-            return 1
+            # Both arguments come from title_raw/series_raw, which are already lowercase.
+            text = f"{series_name}\n{collection_title}"
+            found = {m[0] for m in SERIES_OVERRIDES_PATTERN.finditer(text)}
+            if not found:
+                return 1
+            _, type_id = min(OVERRIDE_BY_KEYWORD[keyword] for keyword in found)
+            return type_id
 
         def parse_volume_number(raw_title: str) -> tuple[int | None, str | None]:
             """
@@ -267,13 +386,7 @@ class MetadataProcessing:
                 tuple[int | None, str | None]: (volume_number or None, remaining_title or None)
             """
 
-            pattern = (
-                r"(?:vol(?:ume)?|book)\.?\s*"
-                r"(\d+|one|two|three|four|five|six|seven|eight|nine|ten|"
-                r"eleven|twelve)\s*[:\-]?\s*(.*)"
-            )
-
-            match = re.match(pattern, raw_title, re.I)
+            match = cls.VOLUME_PATTERN.match(raw_title)
             if not match:
                 return None, None
 
@@ -283,10 +396,8 @@ class MetadataProcessing:
             if num_text.isdigit():
                 volume_num = int(num_text)
             else:
-                try:
-                    volume_num = int(w2n.word_to_num(num_text))
-                except ValueError:
-                    volume_num = 0  #! Need a logic check later as 0 signals error!.
+                #! Need a logic check later as 0 signals error!.
+                volume_num = _WORD_NUM.get(num_text, 0)
             return volume_num, rest
 
         series_name, collection_title = split_title_and_series(title_raw, series_raw)
@@ -301,21 +412,12 @@ class MetadataProcessing:
                 # collection_title = rest_title
                 pass
 
-        if volume_num is None:
-            logging.warning("Could not find a good volume number!")
-            # self.title_info["title"] = str(self.raw_info.title)
-            # self.title_info["series"] = str(self.raw_info.series)
-            self.title_info["title"] = self.title_case(collection_title)
-            self.title_info["series"] = self.title_case(series_name)
-            self.title_info["collection_type"] = collection_type
-            self.title_info["volume_num"] = self.raw_info.volume_num or 0
-            return self.title_info
-
-        self.title_info["title"] = self.title_case(collection_title)
-        self.title_info["series"] = self.title_case(series_name)
-        self.title_info["collection_type"] = collection_type
-        self.title_info["volume_num"] = volume_num
-        return self.title_info
+        return (
+            cls.title_case(collection_title),
+            cls.title_case(series_name),
+            collection_type,
+            volume_num,
+        )
 
     def check_issue_numbers_match(self) -> bool:
         """
@@ -337,11 +439,14 @@ class MetadataProcessing:
             else ""
         )
 
-        for pat in self.PATTERNS:
-            m = pat.search(fname)
-            if m:
-                volume = int(m.group("num").lstrip("0") or "0")
-                return volume, 0
+        m = self.FILENAME_VOLUME_PATTERN.search(fname)
+        if m:
+            num = m.group("v1") or m.group("v2")
+            return int(num.lstrip("0") or "0"), 0
+
+        m = self.FILENAME_NUMBER_PATTERN.search(fname)
+        if m:
+            return int(m.group("num").lstrip("0") or "0"), 0
 
         m = self.SPECIAL_PATTERN.search(fname)
         if m:
@@ -390,9 +495,9 @@ class MetadataProcessing:
         )
         return self.out_data
 
-    @staticmethod
-    def sanitise(filename: str) -> str:
-        santised = re.sub(r'[<>:"/\\|?*]', "-", filename)
+    @classmethod
+    def sanitise(cls, filename: str) -> str:
+        santised = cls.SANITISE_PATTERN.sub("-", filename)
         santised = santised.rstrip(" .")
         return santised
 
@@ -400,14 +505,10 @@ class MetadataProcessing:
         if not hasattr(self, "out_data"):
             self.run()
 
-        date_suffix = f"{calendar.month_abbr[self.out_data.month]} {self.out_data.year}"  # type: ignore
+        date_suffix = f"{MONTH_ABBR[self.out_data.month]} {self.out_data.year}"  # type: ignore
         volume_num = self.out_data.volume_num
-        collection_id = self.out_data.collection_type
-        collection_name = ""
-        for _, val, abbr in SERIES_OVERRIDES:
-            if val == collection_id:
-                collection_name = abbr.strip()
-                break
+        collection_id = self.out_data.collection_type or 0
+        collection_name = COLLECTION_BY_ID.get(collection_id, "")
         series_name = self.sanitise(str(self.out_data.series)).strip()
         title_name = self.sanitise(str(self.out_data.title)).strip()
         filename = f"{series_name} - {title_name} {collection_name} #0{volume_num} ({date_suffix}).cbz"  # noqa: E501
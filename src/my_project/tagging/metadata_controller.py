@@ -1,25 +1,39 @@
-import calendar
+import errno
+import functools
 import logging
+import multiprocessing
 import os
-import re
 import shutil
 import sqlite3
 import zipfile
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
+from xml.etree.ElementTree import Element, ParseError  # type: ignore
 
-from defusedxml import ElementTree as ET
 from dotenv import load_dotenv
-from PySide6.QtWidgets import QMainWindow
 
 from my_project.classes.helper_classes import ComicInfo, ComicVineIssueStruct
 from my_project.database.db_input import MetadataInputting, insert_new_publisher
+from my_project.database.db_utils import get_connection
 from my_project.database.gui_repo_worker import RepoWorker
 from my_project.database.search import insert_into_fts5
 from my_project.tagging.applier import TagApplication
 from my_project.tagging.comic_match_logic import ComicMatch, ResultsFilter
-from my_project.tagging.extract_meta_xml import MetadataExtraction
-from my_project.tagging.metadata_cleaning import MetadataProcessing, PublisherNotKnown
+from my_project.tagging.extract_meta_xml import MetadataExtraction, parse_comicinfo
+from my_project.tagging.metadata_cleaning import (
+    COLLECTION_BY_ID,
+    MONTH_ABBR,
+    MetadataProcessing,
+    clear_publisher_cache,
+)
 from my_project.tagging.metadata_inserter import MetadataInserter
 from my_project.tagging.tagging_controller import (  # extract_and_insert
     RequestData,
@@ -27,24 +41,41 @@ from my_project.tagging.tagging_controller import (  # extract_and_insert
 )
 from my_project.utils.cover_processing import ImageExtraction
 from my_project.utils.file_utils import convert_cbz, generate_uuid
+from my_project.utils.logging_setup import configure_logging
+
+# Only needed for annotations; importing Qt here would load it in every worker.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QMainWindow
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 
 load_dotenv()
 API_KEY = os.getenv("API_KEY", "")
 root_folder = os.getenv("ROOT_DIR")
 ROOT_DIR = Path(root_folder if root_folder is not None else "")
 
-SERIES_OVERRIDES = [
-    ("tpb", 1, "TPB"),
-    ("omnibus", 2, "Omni"),
-    ("modern era epic collection", 4, "MEC"),
-    ("epic collection", 3, "EC"),
-]
+# Covers are resized and saved here while the next comic is processed; Pillow
+# releases the GIL while decoding and encoding.
+_COVER_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+
+# The local file header signature every zip archive starts with.
+ZIP_MAGIC = b"PK\x03\x04"
+IMAGE_EXTS = frozenset(("jpg", "jpeg", "png", "gif", "webp"))
+# ComicInfo.xml is normally a few KB; anything past this is not read.
+MAX_COMICINFO_SIZE = 1024 * 1024
+UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+# The ComicInfo.xml tags that must be filled in to skip online tagging.
+REQUIRED_FIELDS = (
+    "Title",
+    "Series",
+    "Year",
+    "Number",
+    "Writer",
+    "Penciller",
+    "Summary",
+)
+REQUIRED_TAG_MARKERS = {tag: f"<{tag}".encode() for tag in REQUIRED_FIELDS}
+# The Windows error code for a rename across drives.
+ERROR_NOT_SAME_DEVICE = 17
 
 
 def get_comicid_from_path(path: Path) -> int:
@@ -58,17 +89,78 @@ def get_comicid_from_path(path: Path) -> int:
         LookupError: if the comic is not found in the database.
     """
     path = Path(path)
-    conn = sqlite3.connect("comics.db")
-    cursor = conn.cursor()
-    cursor.execute("SELECT id FROM comics WHERE path = ?", (str(path),))
-    result = cursor.fetchone()
-    conn.close()
+    # Paths are stored relative to the root directory, see insert_filepath.
+    if path.is_absolute() and path.is_relative_to(ROOT_DIR):
+        path = path.relative_to(ROOT_DIR)
+    result = (
+        get_connection()
+        .execute("SELECT id FROM comics WHERE file_path = ?", (str(path),))
+        .fetchone()
+    )
     if result:
         return result[0]
     else:
         raise LookupError(f"No comic found in database for path: {path}")
 
 
+def _raise_if_pending(comic_info: ComicInfo) -> None:
+    """
+    Checks that no field of the cleaned metadata was left as the "PENDING"
+    placeholder. Fields are read directly rather than through model_dump so no
+    copy of the model is made.
+
+    Args:
+        comic_info (ComicInfo): The cleaned metadata for the comic.
+
+    Raises:
+        ValueError: If a required field is still "PENDING".
+    """
+    for key in ComicInfo.model_fields:
+        if getattr(comic_info, key) == "PENDING":
+            logging.error("Missing required %s field.", key)
+            # Need to remove ComicInfo.xml and
+            # wait until sufficient data is supplied.
+            raise ValueError(f"Missing required {key} field.")
+
+
+def _is_cross_device(error: OSError) -> bool:
+    """
+    Checks whether a rename failed because the source and destination are on
+    different drives, in which case the file has to be copied instead.
+
+    Args:
+        error (OSError): The error raised by os.rename.
+
+    Returns:
+        bool: True for EXDEV, or ERROR_NOT_SAME_DEVICE on Windows.
+    """
+    return (
+        error.errno == errno.EXDEV
+        or getattr(error, "winerror", None) == ERROR_NOT_SAME_DEVICE
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _publisher_folders() -> dict[int, Path]:
+    """
+    Maps each publisher ID to its folder in the root directory, e.g.
+    1 -> ROOT_DIR / "1 - Marvel Comics".
+
+    Only the top level of the root directory is scanned, and only once; call
+    `_publisher_folders.cache_clear()` if the publisher folders change.
+
+    Returns:
+        dict[int, Path]: The publisher ID and the folder its comics are moved into.
+    """
+    folders: dict[int, Path] = {}
+    with os.scandir(ROOT_DIR) as entries:
+        for entry in entries:
+            prefix = entry.name.split(" - ", 1)[0]
+            if prefix.isdigit() and entry.is_dir():
+                folders[int(prefix)] = Path(entry.path)
+    return folders
+
+
 # use Amazing Spider-Man Modern Era Epic Collection: Coming Home
 
 # File Naming System: [Series_Name][Start_Year] -
@@ -78,25 +170,41 @@ def get_comicid_from_path(path: Path) -> int:
 
 
 class MetadataController:
-    def __init__(self, primary_key: str, filepath: Path, display: QMainWindow):
+    def __init__(
+        self, primary_key: str, filepath: Path, display: Optional["QMainWindow"]
+    ):
         self.primary_key = primary_key
         self.original_filepath = filepath
         self.display = display
         self.original_filename = filepath.stem
         self.filepath: Path = filepath
         self.filename: str = filepath.stem
-        self.comic_info: ComicInfo = ComicInfo(
+        self.page_count: Optional[int] = None
+        self._image_names: Optional[list[str]] = None
+        self._comicinfo_bytes: Optional[bytes] = None
+        self._has_comicinfo: Optional[bool] = None
+        self.cover_job: Optional[Future] = None
+        # Set by run_tagger so a batch of comics is written in one transaction.
+        self.conn: Optional[sqlite3.Connection] = None
+        # The new filename and publisher ID, set once the comic is named.
+        self.destination: Optional[tuple[str, int]] = None
+
+    @functools.cached_property
+    def comic_info(self) -> ComicInfo:
+        """
+        The model that embedded metadata is extracted into. It is only built when
+        first needed, as comics read by a worker process never use it here.
+        """
+        return ComicInfo(
             primary_key=self.primary_key,
-            filepath=self.filepath,
+            filepath=self.original_filepath,
             original_filename=self.original_filename,
         )
-        self.page_count: Optional[int] = None
 
     @staticmethod
     def sanitise(filename: str) -> str:
-        santised = re.sub(r'[<>:"/\\|?*]', "-", filename)
-        santised = santised.rstrip(" .")
-        return santised
+        # Shares the cleaner's compiled pattern rather than compiling another.
+        return MetadataProcessing.sanitise(filename)
 
     def reformat(self) -> None:
         """
@@ -104,14 +212,47 @@ class MetadataController:
 
         Raises:
             ValueError: If anything other than a .cbr or .cbz this error is raised.
+            FileExistsError: If a renamed .cbr would replace an existing .cbz.
         """
         temp_filepath = self.original_filepath
         if temp_filepath.suffix == ".cbr":
-            temp_filepath = convert_cbz(temp_filepath)
+            with open(temp_filepath, "rb") as f:
+                magic = f.read(4)
+            if magic == ZIP_MAGIC:
+                # Already a zip with the wrong extension, so just rename it.
+                temp_filepath = temp_filepath.with_suffix(".cbz")
+                if temp_filepath.exists():
+                    raise FileExistsError(f"{temp_filepath} already exists")
+                os.rename(self.original_filepath, temp_filepath)
+            else:
+                temp_filepath = convert_cbz(temp_filepath)
             self.filepath = temp_filepath
         elif temp_filepath.suffix != ".cbz":
             raise ValueError("Wrong filetype.")
 
+    def _inspect_archive(self) -> None:
+        """
+        Opens the comic archive once to list its images and read ComicInfo.xml, so
+        the page count, metadata check and cover extraction share a single pass.
+        """
+        with zipfile.ZipFile(self.filepath, "r") as archive:
+            names = archive.namelist()
+            self._image_names = [
+                f for f in names if f.rpartition(".")[2].lower() in IMAGE_EXTS
+            ]
+            self._comicinfo_bytes = None
+            # NameToInfo is the dict behind getinfo, so this avoids scanning names.
+            xml_info = archive.NameToInfo.get("ComicInfo.xml")
+            self._has_comicinfo = xml_info is not None
+            if xml_info is not None:
+                if xml_info.file_size <= MAX_COMICINFO_SIZE:
+                    self._comicinfo_bytes = archive.read(xml_info)
+                else:
+                    logging.warning(
+                        "ComicInfo.xml is %s bytes, not reading it", xml_info.file_size
+                    )
+        self.page_count = len(self._image_names)
+
     def get_pagecount(self) -> int:
         """
         Gets the number of pages in the comic archive.
@@ -122,75 +263,61 @@ class MetadataController:
         if self.filepath is None:
             logging.error("Filename must not be None")
             raise ValueError("Filename must not be None")
-        with zipfile.ZipFile(self.filepath, "r") as archive:
-            image_exts = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-            image_files = [
-                f
-                for f in archive.namelist()
-                if os.path.splitext(f)[1].lower() in image_exts
-            ]
-            self.page_count = len(image_files)
-
-        return len(image_files)
+        if self._image_names is None:
+            self._inspect_archive()
+        return len(self._image_names)  # type: ignore[arg-type]
 
-    def has_metadata(self) -> bool:
+    def has_metadata(self) -> Optional[Element]:
         """
         Checks that the required metadata fields are complete with some info
         e.g. that they are not blank.
 
         Returns:
-            bool: True if all required info is present, else False.
+            Optional[Element]: The parsed ComicInfo.xml root if all required info
+                is present, else None.
         """
-        required_fields = [
-            "Title",
-            "Series",
-            "Year",
-            "Number",
-            "Writer",
-            "Penciller",
-            "Summary",
-        ]
         if self.filepath is None:
             logging.error("Filename must not be None")
-            return False
-        with zipfile.ZipFile(self.filepath, "r") as archive:
-            image_exts = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-            image_files = [
-                f
-                for f in archive.namelist()
-                if os.path.splitext(f)[1].lower() in image_exts
+            return None
+
+        self._inspect_archive()
+        xml_bytes = self._comicinfo_bytes
+        if xml_bytes is None:
+            logging.warning("ComicInfo.xml is missing.")
+            return None
+
+        # A tag whose opening bracket never appears in the raw bytes can't be in
+        # the tree either, so incomplete files are rejected without parsing.
+        # UTF-16 files are left to the parser.
+        if not xml_bytes.startswith(UTF16_BOMS):
+            missing = [
+                tag
+                for tag, marker in REQUIRED_TAG_MARKERS.items()
+                if marker not in xml_bytes
             ]
-            self.page_count = len(image_files)
-            if "ComicInfo.xml" in archive.namelist():
-                with archive.open("ComicInfo.xml") as xml_file:
-                    try:
-                        tree = ET.parse(xml_file)
-                        root = tree.getroot()
-                        if root:
-                            missing = [
-                                tag
-                                for tag in required_fields
-                                if root.find(tag) is None or root.find(tag) == ""
-                            ]
-
-                            if missing:
-                                logging.error(
-                                    f"ComicInfo.xml is missing tags: {missing}"
-                                )
-                                return False
-                            else:
-                                logging.debug("ComicInfo.xml is valid and complete")
-                                return True
-                        else:
-                            logging.warning("No content in XML")
-                            return False
-
-                    except ET.ParseError:
-                        logging.warning("ComicInfo.xml is present but not valid xml")
-                        return False
-            else:
-                logging.warning("ComicInfo.xml is missing.")
-                return False
+            if missing:
+                logging.error("ComicInfo.xml is missing tags: %s", missing)
+                return None
+
+        try:
+            root = parse_comicinfo(xml_bytes)
+        except ParseError:
+            logging.warning("ComicInfo.xml is present but not valid xml")
+            return None
+        if root is None or not len(root):
+            logging.warning("No content in XML")
+            return None
+
+        # One pass over the top-level tags; blank tags count as missing.
+        present = {
+            child.tag for child in root if child.text is not None and child.text.strip()
+        }
+        missing = [tag for tag in REQUIRED_FIELDS if tag not in present]
+        if missing:
+            logging.error("ComicInfo.xml is missing tags: %s", missing)
+            return None
+        logging.debug("ComicInfo.xml is valid and complete")
+        return root
 
     def process(self) -> None:
         """
@@ -198,12 +325,41 @@ class MetadataController:
         into the correct format then it decides if its metadata is sufficient and then decides
         what to do from there.
         """
+        self.finish_processing(self.read_embedded_metadata())
+        if self.cover_job is not None:
+            self.cover_job.result()
+
+    def read_embedded_metadata(self) -> Optional[ComicInfo]:
+        """
+        Puts the comic into the correct format and reads its embedded metadata.
+
+        This only touches the archive itself, not the database or the GUI, so it is
+        safe to run in a worker process.
+
+        Returns:
+            Optional[ComicInfo]: The raw embedded metadata, or None if ComicInfo.xml
+                is missing or incomplete.
+        """
         self.reformat()
-        has_metadata = self.has_metadata()
+        metadata_root = self.has_metadata()
+        if metadata_root is None:
+            return None
+        return self.get_embedded_metadata(metadata_root)
+
+    def finish_processing(
+        self, raw_comic_metadata: Optional[ComicInfo], move: bool = True
+    ) -> None:
+        """
+        Tags the comic if it had no usable metadata, then cleans the metadata, adds the
+        comic to the database, extracts its cover and moves it to the correct folder.
 
-        if has_metadata:
-            raw_comic_metadata: ComicInfo = self.get_embedded_metadata()
-        else:
+        Args:
+            raw_comic_metadata (Optional[ComicInfo]): The result of
+                read_embedded_metadata for this comic.
+            move (bool): Whether to move the comic straight away. run_tagger passes
+                False and moves it once its rows are committed.
+        """
+        if raw_comic_metadata is None:
             tag_applier = self.get_one_result()
             if tag_applier:
                 raw_comic_metadata = tag_applier.create_metadata_dict()
@@ -212,16 +368,13 @@ class MetadataController:
         clean_comic_metadata: ComicInfo = self.clean_embedded_metadata(
             raw_comic_metadata
         )
-        for key, value in clean_comic_metadata.model_dump().items():
-            if value == "PENDING":
-                logging.error(f"Missing required {key} field.")
-                # Need to remove ComicInfo.xml and
-                # wait until sufficient data is supplied.
-                raise ValueError(f"Missing required {key} field.")
+        _raise_if_pending(clean_comic_metadata)
 
-        new_name, publisher_int = self.create_name(clean_comic_metadata)
+        self.destination = self.create_name(clean_comic_metadata)
 
-        inserter = MetadataInserter(clean_comic_metadata, self.filepath)
+        inserter = MetadataInserter(
+            clean_comic_metadata, self.filepath, self._has_comicinfo
+        )
         if inserter.create_valid_struc():
             inserter.run_inserter()
         else:
@@ -229,69 +382,70 @@ class MetadataController:
 
         self.insert_into_db(clean_comic_metadata)
         self.extract_cover()
-        self.move_to_publisher_folder(new_name, publisher_int)
+        if move:
+            self.move_to_publisher_folder(*self.destination)
 
         # This all needs to be split up into modular components so the different aspects, db insertion, cover extracting
         # are independent and use the same data types to ensure consistency.
 
     def create_name(self, clean_metadata: ComicInfo) -> tuple[str, int]:
-        date_suffix = (
-            f"{calendar.month_abbr[clean_metadata.month]} {clean_metadata.year}"  # type: ignore
-        )
+        date_suffix = f"{MONTH_ABBR[clean_metadata.month]} {clean_metadata.year}"  # type: ignore
         volume_num = clean_metadata.volume_num
-        collection_id = clean_metadata.collection_type
-        collection_name = ""
-        for _, val, abbr in SERIES_OVERRIDES:
-            if val == collection_id:
-                collection_name = abbr.strip()
-                break
+        collection_name = COLLECTION_BY_ID.get(clean_metadata.collection_type, "")  # type: ignore
         series_name = self.sanitise(str(clean_metadata.series)).strip()
         title_name = self.sanitise(str(clean_metadata.title)).strip()
         filename = f"{series_name} - {title_name} {collection_name} #0{volume_num} ({date_suffix}).cbz"  # noqa: E501
         filename = self.sanitise(filename).strip()
         return filename, clean_metadata.publisher_id  # type: ignore
 
-    def get_embedded_metadata(self) -> ComicInfo:
-        with MetadataExtraction(self.comic_info) as extractor:
+    def get_embedded_metadata(
+        self, metadata_root: Optional[Element] = None
+    ) -> ComicInfo:
+        with MetadataExtraction(self.comic_info, metadata_root) as extractor:
             return extractor.run()
 
     def clean_embedded_metadata(self, raw_data: ComicInfo) -> ComicInfo:
+        self.ensure_publisher_known(raw_data)
         with MetadataProcessing(raw_data) as cleaner:
-            try:
-                cleaned_comic_info = cleaner.run()
-                # new_name, publisher_int = cleaner.new_filename_and_folder()
-                # ! Take this function from metadata_cleaning and use in this class.
-                return cleaned_comic_info
-            except PublisherNotKnown as e:
-                logging.warning(f"Publisher unknown: {e.publisher_name}")
-                insert_new_publisher(e.publisher_name)
-                return self.clean_embedded_metadata(
-                    raw_data
-                )  # This may cause infinite loop!
-
-    def process_with_metadata(self) -> None:
+            # new_name, publisher_int = cleaner.new_filename_and_folder()
+            # ! Take this function from metadata_cleaning and use in this class.
+            return cleaner.run()
+
+    def ensure_publisher_known(self, raw_data: ComicInfo) -> None:
+        """
+        Adds the comic's publisher to the database before cleaning if it is not
+        already known, so the metadata only has to be cleaned once.
+
+        Args:
+            raw_data (ComicInfo): The raw metadata for the comic.
+        """
+        # match_publisher falls back to Marvel when no publisher is given.
+        publisher_name = raw_data.publisher if raw_data.publisher else "Marvel"
+        if MetadataProcessing.is_known_publisher(publisher_name):
+            return
+        logging.warning("Publisher unknown: %s", publisher_name)
+        insert_new_publisher(publisher_name, self.conn)
+        clear_publisher_cache()
+        _publisher_folders.cache_clear()
+
+    def process_with_metadata(self, metadata_root: Optional[Element] = None) -> None:
         """
         This extracts all metadata from the embedded xml, cleans it so that the format is consistent
         across the app. Then it provides the comic with a new filename and filepath, finally it gets
         added to the database, its cover extracted and it is then moved to the correct folder.
+
+        Args:
+            metadata_root (Optional[Element]): The ComicInfo.xml root already parsed by
+                has_metadata, if available, so the archive is not read again.
         """
-        with MetadataExtraction(self.comic_info) as extractor:
+        with MetadataExtraction(self.comic_info, metadata_root) as extractor:
             raw_comic_info = extractor.run()
+        self.ensure_publisher_known(raw_comic_info)
         with MetadataProcessing(raw_comic_info) as cleaner:
-            try:
-                cleaned_comic_info = cleaner.run()
-                new_name, publisher_int = cleaner.new_filename_and_folder()
-            except PublisherNotKnown as e:
-                logging.warning(f"Publisher unknown: {e.publisher_name}")
-                insert_new_publisher(e.publisher_name)
-                return
-
-        for key, value in cleaned_comic_info.model_dump().items():
-            if value == "PENDING":
-                logging.error(f"Missing required {key} field.")
-                # Need to remove ComicInfo.xml and
-                # wait until sufficient data is supplied.
-                raise ValueError(f"Missing required {key} field.")
+            cleaned_comic_info = cleaner.run()
+            new_name, publisher_int = cleaner.new_filename_and_folder()
+
+        _raise_if_pending(cleaned_comic_info)
 
         self.insert_into_db(cleaned_comic_info)
         self.extract_cover()
@@ -347,54 +501,83 @@ class MetadataController:
         Raises:
             ValueError: If in the process of inputting there is an error, this is raised.
         """
-        print("[INFO] Starting inputting data to the database")
+        logging.info("Starting inputting data to the database")
         self.page_count = (
             self.get_pagecount() if self.page_count is None else self.page_count
         )
-        inputter = MetadataInputting(cleaned_comic_info, self.page_count)
+        inputter = MetadataInputting(cleaned_comic_info, self.page_count, self.conn)
         try:
+            # The comic's rows and its search entry go in one transaction.
             inputter.run()
             flat_data = inputter.flatten_data()
+            insert_into_fts5(flat_data, inputter.conn)
+            inputter.commit()
         except Exception as e:
             raise ValueError(f"[Error] {e}") from e
-        insert_into_fts5(flat_data)
         logging.info("Success! Added all data to the database")
         self.inputter = inputter
 
-    def extract_cover(self):
+    def extract_cover(self) -> Optional[Future]:
         """
         This extracts the cover image from the archive and adds it to the .covers folder in the
-        root directory.
+        root directory. The cover is read straight away, as the archive is moved next, but it is
+        resized and saved on a background thread.
+
+        Returns:
+            Optional[Future]: The job saving the cover, or None if it could not be read.
         """
         logging.info("Starting cover extraction")
 
         image_proc = ImageExtraction(
-            self.filepath, ROOT_DIR / ".covers", self.primary_key
+            self.filepath, ROOT_DIR / ".covers", self.primary_key, self._image_names
         )
-        image_proc.run()
+        try:
+            image_proc.extract_image_bytes()
+        except Exception as e:
+            logging.error(e)
+            return None
+        self.cover_job = _COVER_POOL.submit(image_proc.run)
+        return self.cover_job
 
     def move_to_publisher_folder(self, new_name: str, publisher_int: int) -> None:
         """
         Moves the comic archive to the correct folder, depending on the publisher.
+        A comic already at the new path is never overwritten.
 
         Args:
             new_name (str): The name of the comic archive that was decided from metadata.
             publisher_int (int): The unique ID of the publisher, these align with the database ID's.
         """
-        for subdir in ROOT_DIR.iterdir():
-            if subdir.is_dir() and subdir.name.startswith(str(publisher_int)):
-                new_path = subdir / new_name
-                shutil.move(self.original_filepath, new_path)
-                logging.info(f"Moved file to {subdir.name}")
-
-                try:
-                    relative_path = new_path.relative_to(ROOT_DIR)
-                    self.inputter.insert_filepath(relative_path)
-                except ValueError as e:
-                    logging.error(f"Failed to compute relative path: {e}")
-                # TODO: Implement code to recover correct path, not urgent.
-                logging.info("Inserted filepath to database")
-                self.inputter.conn.close()
+        subdir = _publisher_folders().get(publisher_int)
+        if subdir is None:
+            # The folder may have been created since the map was built.
+            _publisher_folders.cache_clear()
+            subdir = _publisher_folders().get(publisher_int)
+        if subdir is None:
+            logging.error("No folder found for publisher ID %s", publisher_int)
+            return
+        new_path = subdir / new_name
+        if new_path.exists():
+            logging.error("Not moving %s, %s already exists", self.filepath, new_path)
+            return
+        # self.filepath is the .cbz; a converted .cbr no longer exists.
+        try:
+            # A single rename when the downloads folder is on the same drive.
+            os.rename(self.filepath, new_path)
+        except OSError as e:
+            if not _is_cross_device(e):
+                raise
+            shutil.move(self.filepath, new_path)
+        logging.info("Moved file to %s", subdir.name)
+
+        try:
+            relative_path = new_path.relative_to(ROOT_DIR)
+            self.inputter.insert_filepath(relative_path)
+        except ValueError as e:
+            logging.error("Failed to compute relative path: %s", e)
+        # TODO: Implement code to recover correct path, not urgent.
+        logging.info("Inserted filepath to database")
+        self.inputter.close()
 
     def rank_results(self, all_results, comic_info):
         with ResultsFilter(all_results, comic_info, self.filepath) as filterer:
@@ -414,32 +597,181 @@ class MetadataController:
         return None
 
 
-VALID_EXTENSIONS = {".cbz", ".cbr", ".zip"}
-EXCLUDE = {
-    "0 - Downloads",
-    "1 - Marvel Comics",
-    "2 - DC Comics",
-    "3 - Image Comics",
-    "4 - Dark Horse Comics",
-    "5 - IDW Comics",
-    "6 - Valiant Comics",
-    "7 - 2000AD Comics",
-    "8 - Urban Comics",
-}
+VALID_EXTENSIONS = (".cbz", ".cbr", ".zip")
+# How many comics run_tagger writes to the database per transaction.
+COMMIT_EVERY = 32
+EXCLUDE = frozenset(
+    {
+        "0 - Downloads",
+        "1 - Marvel Comics",
+        "2 - DC Comics",
+        "3 - Image Comics",
+        "4 - Dark Horse Comics",
+        "5 - IDW Comics",
+        "6 - Valiant Comics",
+        "7 - 2000AD Comics",
+        "8 - Urban Comics",
+    }
+)
+
+
+def _iter_archives(root: Path) -> Iterator[Path]:
+    """
+    Recursively yields the comic archives under a directory.
+
+    Uses os.scandir so entry types come from the directory listing rather than
+    a stat per path, and never descends into the EXCLUDE folders.
+
+    Args:
+        root (Path): The directory to search.
+
+    Yields:
+        Path: The filepath of each archive with a valid extension.
+    """
+    # Folders are kept as plain strings; only matching files become Paths.
+    stack: list[str] = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(VALID_EXTENSIONS) and entry.is_file():
+                    yield Path(entry.path)
+
+
+@contextmanager
+def _comic_savepoint(conn: sqlite3.Connection) -> Iterator[None]:
+    """
+    Wraps one comic's writes on the shared connection in a savepoint, so a
+    comic that fails partway leaves none of its rows behind, while the comics
+    before it in the batch stay pending for the next commit.
+
+    A transaction is opened first if none is, as releasing the outermost
+    savepoint would otherwise commit the batch. On rollback the publisher
+    caches are cleared too, as they may hold a publisher the comic added.
+
+    Args:
+        conn (sqlite3.Connection): The connection the batch is written through.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute("SAVEPOINT comic")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK TO comic")
+        conn.execute("RELEASE comic")
+        clear_publisher_cache()
+        _publisher_folders.cache_clear()
+        raise
+    conn.execute("RELEASE comic")
+
+
+def _commit_and_move(
+    conn: sqlite3.Connection, pending: list[MetadataController]
+) -> None:
+    """
+    Commits the batch, then moves its comics out of the downloads folder and
+    commits their new filepaths. A comic is never moved before its rows are
+    committed, so a crash can't leave a moved comic missing from the database.
+
+    Args:
+        conn (sqlite3.Connection): The connection the batch is written through.
+        pending (list[MetadataController]): The processed comics still to be
+            moved. Emptied as they are moved.
+    """
+    conn.commit()
+    while pending:
+        controller = pending.pop(0)
+        new_name, publisher_int = controller.destination  # type: ignore[misc]
+        controller.move_to_publisher_folder(new_name, publisher_int)
+    conn.commit()
+
+
+def _read_comic(
+    primary_key: str, path: Path
+) -> tuple[Path, Optional[list[str]], Optional[bool], Optional[ComicInfo]]:
+    """
+    Worker process entry point which does the read-only part of processing a comic.
+
+    Args:
+        primary_key (str): The ID the comic will be given in the database.
+        path (Path): The filepath of the comic archive.
+
+    Returns:
+        tuple[Path, Optional[list[str]], Optional[bool], Optional[ComicInfo]]: The
+            filepath after any reformatting, the image files in the archive,
+            whether it contains a ComicInfo.xml and the raw embedded metadata if
+            present.
+    """
+    controller = MetadataController(primary_key, path, None)
+    raw_comic_metadata = controller.read_embedded_metadata()
+    return (
+        controller.filepath,
+        controller._image_names,
+        controller._has_comicinfo,
+        raw_comic_metadata,
+    )
 
 
-def run_tagger(display: QMainWindow):
+def run_tagger(display: Optional["QMainWindow"]):
     downloads_dir = ROOT_DIR / "0 - Downloads"
-    for path in downloads_dir.rglob("*"):
-        if path.is_dir() and path.name in EXCLUDE:
-            continue
-        if path.is_file() and any(
-            path.name.lower().endswith(ext) for ext in VALID_EXTENSIONS
-        ):
-            logging.info(f"Starting to process {path.name}")
-            with RepoWorker() as worker:
-                if worker.comic_in_db(path):
-                    return None
-            new_id = generate_uuid()
-            cont = MetadataController(new_id, path, display)
-            cont.process()
+    with RepoWorker() as worker:
+        known = worker.known_paths()
+    paths = [
+        path
+        for path in _iter_archives(downloads_dir)
+        if str(path.relative_to(ROOT_DIR)) not in known
+    ]
+    if not paths:
+        return
+
+    # Archive reading and XML parsing run in parallel; tagging, database writes and
+    # file moves stay in this process so SQLite and the GUI are only used here.
+    conn = get_connection()
+    processed = 0
+    cover_jobs: list[Future] = []
+    pending: list[MetadataController] = []
+    workers = min(len(paths), os.cpu_count() or 1)
+    try:
+        # Spawned rather than forked workers: this process runs Qt threads and
+        # holds an open SQLite connection, neither of which survives a fork. Each
+        # worker sets up its own logging, as it never runs main.py.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=configure_logging,
+        ) as pool:
+            futures = {}
+            for path in paths:
+                new_id = generate_uuid()
+                futures[pool.submit(_read_comic, new_id, path)] = (new_id, path)
+            for future in as_completed(futures):
+                new_id, path = futures[future]
+                logging.info("Starting to process %s", path.name)
+                filepath, image_names, has_comicinfo, raw_comic_metadata = (
+                    future.result()
+                )
+                if raw_comic_metadata is None:
+                    # Tagging may wait on the user, so don't hold the write lock.
+                    _commit_and_move(conn, pending)
+                cont = MetadataController(new_id, path, display)
+                cont.conn = conn
+                cont.filepath = filepath
+                cont._has_comicinfo = has_comicinfo
+                if image_names is not None:
+                    cont._image_names = image_names
+                    cont.page_count = len(image_names)
+                with _comic_savepoint(conn):
+                    cont.finish_processing(raw_comic_metadata, move=False)
+                pending.append(cont)
+                if cont.cover_job is not None:
+                    cover_jobs.append(cont.cover_job)
+                processed += 1
+                if processed % COMMIT_EVERY == 0:
+                    _commit_and_move(conn, pending)
+    finally:
+        # Comics processed before a failure keep their rows and are moved.
+        _commit_and_move(conn, pending)
+        wait(cover_jobs)
@@ -7,9 +7,9 @@ comic archives by extracting and re-packaging comic archive files.
 """
 
 import os
+import time
 import xml.etree.ElementTree as ET  # nosec
 import zipfile
-from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
@@ -70,17 +70,57 @@ class MetadataInserter:
             as the process runs.
     """
 
-    def __init__(self, clean_info: ComicInfo, filepath: Path):
+    # The fields that are marked PENDING rather than MISSING when empty.
+    MANDATORY_FIELDS = frozenset(
+        {
+            "Writer",
+            "Penciller",
+            "Year",
+            "Summary",
+            "Number",
+            "Series",
+            "Title",
+        }
+    )
+    # The creator roles in `ComicInfo.xml`, in the order they are written.
+    ROLE_TITLES = (
+        "Penciller",
+        "Writer",
+        "Inker",
+        "Editor",
+        "Letterer",
+        "CoverArtist",
+        "Colorist",
+    )
+    # Lower case role names from the metadata and the role title they belong to.
+    ROLE_ALIASES = {
+        "penciler": "Penciller",
+        "writer": "Writer",
+        "inker": "Inker",
+        "editor": "Editor",
+        "letterer": "Letterer",
+        "cover": "CoverArtist",
+        "colorist": "Colorist",
+        "artist": "Penciller",
+    }
+
+    def __init__(
+        self, clean_info: ComicInfo, filepath: Path, has_xml: Optional[bool] = None
+    ):
         """
         Initialises the instance variables.
 
         Args:
             clean_info (ComicInfo): The cleaned ComicInfo struct.
             filepath (Path): The filepath of the comic.
+            has_xml (Optional[bool]): Whether the archive already contains a
+                `ComicInfo.xml`, if the caller has already listed it. When None
+                the archive is checked before writing.
         """
         self.info = clean_info
         self.path = filepath
         self.pending = False
+        self.has_xml = has_xml
 
     def create_valid_struc(self) -> bool:
         """
@@ -112,13 +152,13 @@ class MetadataInserter:
         self.information = self.fill_gaps(information)
         return not self.pending
 
-    def create_xml(self) -> bytes:
+    def create_xml(self) -> ET.ElementTree:
         """
         Takes the data in `self.information` and turns it into the root
         element of an XML file.
 
         Returns:
-            bytes: The bytes representation of the XML file.
+            ET.ElementTree: The tree of the XML file.
         """
         root = ET.Element("ComicInfo")
 
@@ -126,20 +166,33 @@ class MetadataInserter:
             child = ET.SubElement(root, key)
             child.text = str(value)
 
-        xml_bytes = BytesIO()
-        tree = ET.ElementTree(root)
-        tree.write(xml_bytes, encoding="utf-8", xml_declaration=True)
-        return xml_bytes.getvalue()
+        return ET.ElementTree(root)
+
+    @staticmethod
+    def write_xml(tree: ET.ElementTree, archive: zipfile.ZipFile) -> None:
+        """
+        Writes the XML file straight into an open archive as `ComicInfo.xml`,
+        without serialising it into a separate buffer first.
 
-    def insert_xml(self, xml_bytes: bytes) -> None:
+        Args:
+            tree (ET.ElementTree): The tree of the XML file.
+            archive (zipfile.ZipFile): The archive, open for writing.
+        """
+        # Unlike writestr, open does not stamp a new entry with the current time.
+        info = zipfile.ZipInfo("ComicInfo.xml", time.localtime()[:6])
+        info.compress_type = archive.compression
+        with archive.open(info, "w") as xml_file:
+            tree.write(xml_file, encoding="utf-8", xml_declaration=True)
+
+    def insert_xml(self, tree: ET.ElementTree) -> None:
         """
         Inserts the XML file into the comic archive.
 
         Args:
-            xml_bytes (bytes): The bytes of the XML file to insert.
+            tree (ET.ElementTree): The tree of the XML file to insert.
         """
         with zipfile.ZipFile(self.path, "a") as cbz:
-            cbz.writestr("ComicInfo.xml", xml_bytes)
+            self.write_xml(tree, cbz)
 
     def already_has_xml(self) -> bool:
         """
@@ -173,24 +226,8 @@ class MetadataInserter:
             dict[str, str]: A dictionary where the keys are the role titles and the values
             are strings of names separated by commas and then a space.
         """
-        mapping_ = {
-            "penciler": "Penciller",
-            "writer": "Writer",
-            "inker": "Inker",
-            "editor": "Editor",
-            "letterer": "Letterer",
-            "cover": "CoverArtist",
-            "colorist": "Colorist",
-            "artist": "Penciller",
-        }
         dummy_creator_dict: dict[str, list[str]] = {
-            "Penciller": [],
-            "Writer": [],
-            "Inker": [],
-            "Editor": [],
-            "Letterer": [],
-            "CoverArtist": [],
-            "Colorist": [],
+            title: [] for title in MetadataInserter.ROLE_TITLES
         }
         creator_dict: dict[str, str] = {}
 
@@ -199,10 +236,10 @@ class MetadataInserter:
                 continue
             roles = [r.strip() for r in role.split(",")]
             for role in roles:
-                if role in dummy_creator_dict.keys():
+                if role in dummy_creator_dict:
                     dummy_creator_dict[role].append(person)
-                elif role in mapping_.keys():
-                    role_real = mapping_[role]
+                elif role in MetadataInserter.ROLE_ALIASES:
+                    role_real = MetadataInserter.ROLE_ALIASES[role]
                     dummy_creator_dict[role_real].append(person)
 
         for title, names in dummy_creator_dict.items():
@@ -222,29 +259,20 @@ class MetadataInserter:
             XMLStruc: The completed :class`XMLStruc` that has the empty fields
             replaced with the relevant string marker.
         """
-        MANDATORY_FIELDS = {
-            "Writer",
-            "Penciller",
-            "Year",
-            "Summary",
-            "Number",
-            "Series",
-            "Title",
-        }
-
         data = comic_info.model_dump()
 
-        for field in MANDATORY_FIELDS:
-            if field not in data or not data[field]:
-                data[field] = "PENDING"
+        for key, value in data.items():
+            if value:
+                continue
+            if key in MetadataInserter.MANDATORY_FIELDS:
+                data[key] = "PENDING"
                 self.pending = True
-        for key in list(data.keys()):
-            if key not in MANDATORY_FIELDS and not data[key]:
+            else:
                 data[key] = "MISSING"
 
         return comic_info.model_copy(update=data)
 
-    def replace_xml(self, xml_bytes: bytes) -> None:
+    def replace_xml(self, tree: ET.ElementTree) -> None:
         """
         Replaces the `ComicInfo.xml` file from a comic archive.
 
@@ -253,7 +281,7 @@ class MetadataInserter:
         into a comic archive.
 
         Args:
-            xml_bytes (bytes): The bytes of the XML file to insert.
+            tree (ET.ElementTree): The tree of the XML file to insert.
         """
         temp_path = self.path.with_suffix(".tmp")
         try:
@@ -264,7 +292,7 @@ class MetadataInserter:
                 for item in zin.infolist():
                     if item.filename != "ComicInfo.xml":
                         zout.writestr(item, zin.read(item.filename))
-                zout.writestr("ComicInfo.xml", xml_bytes)
+                self.write_xml(tree, zout)
 
             os.replace(temp_path, self.path)
         except Exception:
@@ -276,7 +304,8 @@ class MetadataInserter:
         """Basic flow for running the process of inserting `ComicInfo.xml"""
         xml = self.create_xml()
 
-        if self.already_has_xml():
+        has_xml = self.has_xml if self.has_xml is not None else self.already_has_xml()
+        if has_xml:
             self.replace_xml(xml)
         else:
             self.insert_xml(xml)
@@ -10,13 +10,6 @@ from my_project.classes.helper_classes import (
     ComicVineIssueStruct,
 )
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
-
 header = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
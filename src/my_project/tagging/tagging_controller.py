@@ -21,11 +21,6 @@ from my_project.tagging.validator import IssueResponseValidator, SearchResponseV
 
 load_dotenv()
 API_KEY = os.getenv("API_KEY")
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
 
 
 class MatchCode(IntEnum):
@@ -17,13 +17,6 @@ from my_project.classes.helper_classes import (
 
 from .requester import RequestData
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
-
 ComicVineResponseList: TypeAlias = (
     list[ComicVineIssueStruct] | list[ComicVineSearchStruct]
 )
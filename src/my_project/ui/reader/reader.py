@@ -4,15 +4,19 @@ of the comic images, so reading is snappy, responsive and the code structure is
 expandable and future-proof.
 """
 
+import functools
 import logging
 import os
+import struct
+import threading
 import zipfile
+import zlib
 from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO
 from pathlib import Path
-from typing import overload
+from typing import Optional, overload
 
 from dotenv import load_dotenv
 from PIL import Image
@@ -54,11 +58,53 @@ resources_path = os.getenv("FRONTEND_RESOURCES")
 if not resources_path:
     raise RuntimeError("FRONTEND_RESOURCES environment variable is not set.")
 IMAGES = Path(resources_path)
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+
+JPEG_EXTS = (".jpg", ".jpeg")
+# Pillow modes Qt can read as they are, with their QImage format and pixel size.
+PIL_FORMATS = {
+    "RGB": (QImage.Format.Format_RGB888, 3),
+    "L": (QImage.Format.Format_Grayscale8, 1),
+}
+# Offset of the name and extra field lengths within a zip entry's local header.
+LOCAL_HEADER_LENGTHS = 26
+LOCAL_HEADER_SIZE = 30
+
+
+@functools.cache
+def _turbo_jpeg():
+    """
+    Loads libjpeg-turbo through PyTurboJPEG the first time a page is decoded.
+
+    Returns:
+        Optional[TurboJPEG]: The decoder, or None if PyTurboJPEG or the library
+            itself is not installed, in which case Pillow decodes every page.
+    """
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError) as e:
+        logging.info("libjpeg-turbo is unavailable, using Pillow: %s", e)
+        return None
+
+
+def _dct_denominator(height: int, target_height: int) -> int:
+    """
+    Picks how far libjpeg can scale a page down while decoding it, which skips
+    the work for pixels that would be thrown away when the page is shown.
+
+    Args:
+        height (int): The full height of the page.
+        target_height (int): The height the page is shown at.
+
+    Returns:
+        int: The largest of 8, 4 and 2 that keeps the page at least as tall as
+            the target, or 1 if the page cannot be scaled down.
+    """
+    for denominator in (8, 4, 2):
+        if height // denominator >= target_height:
+            return denominator
+    return 1
 
 
 class ComicError(Exception):
@@ -142,11 +188,22 @@ class Comic:
         self.path = comic_info.filepath
         self.filename = comic_info.filepath.stem
         self.zip = zipfile.ZipFile(comic_info.filepath, "r")
-        self.image_names = sorted(
-            name
-            for name in self.zip.namelist()
-            if name.lower().endswith((".jpg", ".jpeg", ".png"))
+        # Each loader thread reads through its own handle, so threads never share
+        # a file position; the lock guards the page cache and the handles. These
+        # are keyed by thread id, as threading.local does not persist between
+        # runs on Qt's pool threads.
+        self.archives: dict[int, zipfile.ZipFile] = {threading.get_ident(): self.zip}
+        self.lock = threading.Lock()
+        # Entries are opened through their ZipInfo, which skips the name lookup.
+        self.image_infos = sorted(
+            (
+                info
+                for info in self.zip.infolist()
+                if info.filename.lower().endswith((".jpg", ".jpeg", ".png"))
+            ),
+            key=lambda info: info.filename,
         )
+        self.image_names = [info.filename for info in self.image_infos]
         if not self.image_names:
             raise ComicError("No images found in the file.")
         self.pages = [PageInfo(n, pos) for pos, n in enumerate(self.image_names)]
@@ -185,23 +242,128 @@ class Comic:
         if index < 0 or index >= self.total_pages:
             raise PageIndexError(f"Index {index} out of range.")
 
-        name = self.image_names[index]
-        if name in self.cache:
-            self.cache.move_to_end(name)
-            return self.cache[name]
+        info = self.image_infos[index]
+        name = info.filename
+        with self.lock:
+            if name in self.cache:
+                self.cache.move_to_end(name)
+                return self.cache[name]
 
         try:
-            with self.zip.open(name) as file:
+            with self.archive().open(info) as file:
                 data = file.read()
         except Exception as e:
             raise ImageLoadError(f"Failed to read image {name}: {e}") from e
 
-        self.cache[name] = data
-        if len(self.cache) > self.max_cache:
-            self.cache.popitem(last=False)
-
+        self.cache_data(name, data)
         return data
 
+    def archive(self) -> zipfile.ZipFile:
+        """
+        Gets the calling thread's handle on the comic archive, opening one the
+        first time a thread reads a page.
+
+        Returns:
+            zipfile.ZipFile: The archive, open for reading.
+        """
+        thread = threading.get_ident()
+        with self.lock:
+            archive = self.archives.get(thread)
+        if archive is None:
+            archive = zipfile.ZipFile(self.path, "r")
+            with self.lock:
+                self.archives[thread] = archive
+        return archive
+
+    def close(self) -> None:
+        """Closes every handle on the comic archive. Call once loading has stopped."""
+        with self.lock:
+            for archive in self.archives.values():
+                archive.close()
+            self.archives.clear()
+
+    def cache_data(self, name: str, data: bytes) -> None:
+        """Stores the bytes of a page, evicting the least recently used page if full."""
+        with self.lock:
+            self.cache[name] = data
+            self.cache.move_to_end(name)
+            if len(self.cache) > self.max_cache:
+                self.cache.popitem(last=False)
+
+    def prefetch_range(self, start: int, end: int) -> None:
+        """
+        Reads the pages from `start` up to `end` into the cache with one read of
+        the archive, rather than seeking to and opening each entry in turn. Pages
+        are usually stored one after another, so the read covers little else.
+
+        Only stored and deflated entries are handled here. Any page that is
+        skipped, or whose data does not check out, is left for `get_image_data`
+        to read on its own.
+
+        Args:
+            start (int): The index of the first page to read.
+            end (int): The index after the last page to read.
+        """
+        start = max(start, 0)
+        end = min(end, self.total_pages, start + self.max_cache)
+        with self.lock:
+            infos = [
+                info
+                for info in self.image_infos[start:end]
+                if info.filename not in self.cache
+            ]
+        infos = [
+            info
+            for info in infos
+            if not info.flag_bits & 0x1
+            and info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        ]
+        if len(infos) < 2:
+            return
+        infos.sort(key=lambda info: info.header_offset)
+
+        first = infos[0].header_offset
+        last = infos[-1]
+        # The local header's extra field can differ from the central directory's,
+        # so this is only a guess at where the last entry ends; a short read just
+        # leaves that page to be read on its own.
+        stop = (
+            last.header_offset
+            + LOCAL_HEADER_SIZE
+            + len(last.orig_filename.encode())
+            + len(last.extra)
+            + last.compress_size
+        )
+        # Pages far apart would mean reading much of the archive for nothing.
+        if stop - first > 2 * sum(info.compress_size for info in infos):
+            return
+
+        try:
+            with open(self.path, "rb") as file:
+                file.seek(first)
+                block = file.read(stop - first)
+        except OSError as e:
+            logging.warning("Could not prefetch pages of %s: %s", self.filename, e)
+            return
+
+        try:
+            for info in infos:
+                offset = info.header_offset - first
+                name_len, extra_len = struct.unpack_from(
+                    "<HH", block, offset + LOCAL_HEADER_LENGTHS
+                )
+                offset += LOCAL_HEADER_SIZE + name_len + extra_len
+                payload = block[offset : offset + info.compress_size]
+                if len(payload) < info.compress_size:
+                    continue
+                if info.compress_type == zipfile.ZIP_DEFLATED:
+                    payload = zlib.decompress(payload, -zlib.MAX_WBITS)
+                if zlib.crc32(payload) == info.CRC:
+                    self.cache_data(info.filename, payload)
+        except (struct.error, zlib.error) as e:
+            # A truncated header or corrupt entry; the load tasks read the rest.
+            logging.debug("Stopped prefetching pages of %s: %s", self.filename, e)
+
     def next_image_data(self) -> bytes:
         """
         Increases the index counter by one and gets the bytes content of the next page.
@@ -231,7 +393,7 @@ class Comic:
         """
         page = self.pages[index]
         try:
-            image_bytes = self.zip.read(page.filename)
+            image_bytes = self.archive().read(self.image_infos[index])
         except Exception as e:
             raise ImageLoadError(f"Failed to read image {page.filename}: {e}") from e
         buffer = QBuffer()
@@ -501,15 +663,15 @@ class ImageLoadSignals(QObject):
     bridge between worker threads and main GUI thread.
 
     Signals:
-        finished(int, QPixmap):
-            Emitted when an image has been successfully loaded and converted
-            into a :class`QPixmap`.
+        finished(int, QImage):
+            Emitted when an image has been successfully loaded and decoded
+            into a :class`QImage`.
 
             Args:
                 int:
                     The page index associated with the loaded image.
-                QPixmap:
-                    The resulting pixmap ready for display.
+                QImage:
+                    The decoded page, which the GUI thread turns into a pixmap.
 
         error (int, str):
             Emitted when an exception occurs while loading or processing
@@ -526,7 +688,7 @@ class ImageLoadSignals(QObject):
     the GUI thread.
     """
 
-    finished = Signal(int, QPixmap)
+    finished = Signal(int, QImage)
     error = Signal(int, str)
 
 
@@ -536,8 +698,10 @@ class ImageLoadTask(QRunnable):
 
     This QRunnable is executed by a :class`QThreadPool` to avoid blocking the
     GUI thread while image data is fetched and decoded. The task retrieves raw
-    image bytes from a :class`Comic` instance, converts them into a Pillow image,
-    then transforms the result into a Qt-compatible :class`QPixmap`.
+    image bytes from a :class`Comic` instance and decodes them into a
+    :class`QImage` in a format Qt can draw without converting it. Pixmaps are
+    only safe to create on the GUI thread, so the preloader makes the
+    :class`QPixmap` when the image arrives.
 
     Attributes:
         comic (Comic):
@@ -551,25 +715,28 @@ class ImageLoadTask(QRunnable):
 
     Workflow:
         1. Fetch raw image bytes from comic source.
-        2. Decode image data using Pillow.
-        3. Convert the image to RGBA format.
-        4. Create a :class`QImage` from the raw pixel buffer.
-        5. Convert the QImage into a :class`QPixmap`.
+        2. Decode image data using libjpeg-turbo, or Pillow for other pages.
+        3. Create a :class`QImage` from the raw pixel buffer.
+        4. Convert it to Qt's native 32-bit format, which also copies the pixels
+        out of the decoder's buffer.
+        5. Scale it down to the reader's page height, if taller.
         6. Emit either a success or error signal.
 
     Notes:
         - The image is fully loaded into memory via ``image.load()`` before
         conversion to ensure thread-safe access.
-        - RGBA conversion guarantees a predictable pixel format for Qt.
+        - Only pages with alpha or a palette are converted to RGBA first;
+        RGB and greyscale pages are read by Qt as they are.
         - Exceptions are caught internally and reported through the ``error``
         signal instead of propagating across threads.
     """
 
-    def __init__(self, comic: Comic, index: int):
+    def __init__(self, comic: Comic, index: int, target_height: Optional[int] = None):
         """Initialises the class by assigning the attributes."""
         super().__init__()
         self.comic = comic
         self.index = index
+        self.target_height = target_height
         self.signals = ImageLoadSignals()
 
     def run(self):
@@ -593,22 +760,120 @@ class ImageLoadTask(QRunnable):
         """
         try:
             data = self.comic.get_image_data(self.index)
-            image = Image.open(BytesIO(data))
-            image.load()
-            image = image.convert("RGBA")
+            image = self.decode_jpeg(data)
+            if image is None:
+                image = self.decode_image(data, self.target_height)
+            if self.target_height and image.height() > self.target_height:
+                # Cache the page at the size it is shown at, so turning to it
+                # needs no smooth scale of the full page and it takes less memory.
+                image = image.scaledToHeight(
+                    self.target_height, Qt.TransformationMode.SmoothTransformation
+                )
+
+            self.signals.finished.emit(self.index, image)
 
+        except Exception as e:
+            self.signals.error.emit(self.index, str(e))
+
+    def decode_jpeg(self, data: bytes) -> Optional[QImage]:
+        """
+        Decodes a JPEG page with libjpeg-turbo, straight into a 32-bit RGBX buffer
+        that Qt can use without converting it. Large pages are scaled down while
+        decoding, but never below the height they are shown at.
+
+        Args:
+            data (bytes): The raw bytes of the page.
+
+        Returns:
+            Optional[QImage]: The decoded page, or None if the page is not a JPEG,
+                libjpeg-turbo is unavailable or it could not decode the page.
+        """
+        if not self.comic.image_names[self.index].lower().endswith(JPEG_EXTS):
+            return None
+        jpeg = _turbo_jpeg()
+        if jpeg is None:
+            return None
+
+        from turbojpeg import TJPF_RGBX
+
+        try:
+            scaling_factor = None
+            if self.target_height:
+                _, height, _, _ = jpeg.decode_header(data)
+                denominator = _dct_denominator(height, self.target_height)
+                if denominator > 1:
+                    scaling_factor = (1, denominator)
+            pixels = jpeg.decode(
+                data, pixel_format=TJPF_RGBX, scaling_factor=scaling_factor
+            )
+        except OSError:
+            # e.g. CMYK JPEGs, which Pillow can still convert.
+            return None
+        height, width = pixels.shape[:2]
+        qimage = QImage(
+            pixels.data, width, height, pixels.strides[0], QImage.Format.Format_RGBX8888
+        )
+        # Converting copies the pixels, so the buffer can be freed afterwards.
+        return qimage.convertToFormat(QImage.Format.Format_RGB32)
+
+    @staticmethod
+    def decode_image(data: bytes, target_height: Optional[int] = None) -> QImage:
+        """
+        Decodes a page of any format with Pillow. Large JPEGs are scaled down while
+        decoding, but never below the height they are shown at.
+
+        Args:
+            data (bytes): The raw bytes of the page.
+            target_height (Optional[int]): The height the page is shown at, in
+                device pixels, if known.
+
+        Returns:
+            QImage: The decoded page.
+        """
+        image = Image.open(BytesIO(data))
+        if target_height:
+            # Only JPEGs support this; other formats ignore it.
+            image.draft(None, (1, target_height))
+        image.load()
+        if image.mode in PIL_FORMATS:
+            # Most pages have no alpha, so Qt can read Pillow's pixels directly.
+            source_format, bytes_per_pixel = PIL_FORMATS[image.mode]
             qimage = QImage(
-                image.tobytes("raw", "RGBA"),
+                image.tobytes(),
                 image.width,
                 image.height,
-                QImage.Format.Format_RGBA8888,
+                image.width * bytes_per_pixel,
+                source_format,
             )
-            pixmap = QPixmap.fromImage(qimage)
+            return qimage.convertToFormat(QImage.Format.Format_RGB32)
+
+        image = image.convert("RGBA")
+        qimage = QImage(
+            image.tobytes("raw", "RGBA"),
+            image.width,
+            image.height,
+            QImage.Format.Format_RGBA8888,
+        )
+        return qimage.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
 
-            self.signals.finished.emit(self.index, pixmap)
 
-        except Exception as e:
-            self.signals.error.emit(self.index, str(e))
+class PrefetchTask(QRunnable):
+    """
+    Background task that reads a run of pages into the comic's byte cache with
+    :meth`Comic.prefetch_range`, so the disk read and any inflating happen on
+    the thread pool rather than the GUI thread.
+    """
+
+    def __init__(self, comic: Comic, start: int, end: int):
+        """Initialises the class by assigning the attributes."""
+        super().__init__()
+        self.comic = comic
+        self.start = start
+        self.end = end
+
+    def run(self):
+        """Reads the pages from `start` up to `end` into the cache."""
+        self.comic.prefetch_range(self.start, self.end)
 
 
 class PagePreloader(QObject):
@@ -643,7 +908,8 @@ class PagePreloader(QObject):
             preloaded.
 
         image_cache (dict[int, QPixmap]):
-            In-memory cache mapping page indices to loaded pixmaps.
+            In-memory cache mapping page indices to loaded pixmaps, scaled
+            down to the reader's page height once it is known.
 
         loading (set[int]):
             Set of page indices currently being loaded. Used to prevent
@@ -682,13 +948,19 @@ class PagePreloader(QObject):
         self.backward_buff = 4
 
         self.image_cache: dict[int, QPixmap] = {}
+        # The height pages are shown at, in device pixels, once the reader knows it.
+        self.target_height: Optional[int] = None
         self.pending: list[int] = []
         self.loading: set[int] = set()
         self.wanted: set[int] = set()
         self.failed: set[int] = set()
+        self.stale: set[int] = set()
 
         self.pool = QThreadPool()
         self.pool.setMaxThreadCount(6)
+        # Each thread keeps its own handle on the archive, so keep the threads
+        # rather than letting idle ones expire and new ones open more handles.
+        self.pool.setExpiryTimeout(-1)
 
     def get_load_order(self, indices: tuple[int, ...]) -> list[int]:
         """
@@ -746,9 +1018,30 @@ class PagePreloader(QObject):
             for page in load_order
             if page not in self.loading and page not in self.image_cache
         ]
-
         self.fill_workers()
 
+        # Read the pages still waiting for a worker in one go, off the GUI
+        # thread, so their tasks find the bytes cached.
+        ahead = [page for page in self.pending if page >= indices[0]]
+        if len(ahead) > 1:
+            self.pool.start(PrefetchTask(self.comic, ahead[0], ahead[-1] + 1))
+
+    def set_target_height(self, height: int) -> None:
+        """
+        Sets the height pages are shown at, so they can be decoded at a matching
+        size. Cached pages are dropped if they may now be too small.
+
+        Args:
+            height (int): The height of the reader's page area in device pixels.
+        """
+        if height == self.target_height:
+            return
+        if self.target_height is not None and height > self.target_height:
+            self.image_cache.clear()
+            # Pages loading now are sized for the old height; load them again.
+            self.stale = set(self.loading)
+        self.target_height = height
+
     def fill_workers(self):
         """
         Ensures that all workers in the Pool have a task, provided there are tasks
@@ -774,23 +1067,23 @@ class PagePreloader(QObject):
         """
         self.loading.add(index)
 
-        task = ImageLoadTask(self.comic, index)
+        task = ImageLoadTask(self.comic, index, self.target_height)
         task.signals.finished.connect(self.on_loaded)
         task.signals.error.connect(self.on_error)
 
         self.pool.start(task)
 
-    def on_loaded(self, index: int, pixmap: QPixmap):
+    def on_loaded(self, index: int, image: QImage):
         """
         Handle successful completion of an image loading task.
 
-        The index of the loaded pixmap is checked to ensure it is
-        still wanted, then it's inserted into the cache and the page
-        is marked as no longer loading.
+        The index of the loaded image is checked to ensure it is
+        still wanted, then it's turned into a pixmap and inserted into
+        the cache, and the page is marked as no longer loading.
 
         Args:
             index (int): Index of the loaded page.
-            pixmap (QPixmap): Loaded page image.
+            image (QImage): Decoded page image.
 
         Emits:
             page_ready: Emitted after the image has been stored
@@ -798,8 +1091,12 @@ class PagePreloader(QObject):
         """
         self.loading.discard(index)
 
-        if index in self.wanted:
-            self.image_cache[index] = pixmap
+        if index in self.stale:
+            self.stale.discard(index)
+            if index in self.wanted:
+                self.pending.insert(0, index)
+        elif index in self.wanted:
+            self.image_cache[index] = QPixmap.fromImage(image)
             self.page_ready.emit(index)
         self.fill_workers()
 
@@ -818,6 +1115,7 @@ class PagePreloader(QObject):
         Failed pages are not automatically retried.
         """
         self.loading.discard(index)
+        self.stale.discard(index)
         logging.error(
             "Failed to load page %d (%s): %s",
             index,
@@ -970,6 +1268,12 @@ class SimpleReader(QMainWindow):
         self.shortcut = QShortcut(QKeySequence("F11"), self)
         self.shortcut.activated.connect(self.toggle_fullscreen)
 
+        # The reader opens full screen, so size the first pages for the screen
+        # until a resize gives the real height of the page area.
+        screen = self.screen()
+        self.preloader.set_target_height(
+            round(screen.size().height() * screen.devicePixelRatio())
+        )
         self.display_current_page()
 
     def toggle_fullscreen(self) -> None:
@@ -1133,6 +1437,9 @@ class SimpleReader(QMainWindow):
     def resizeEvent(self, event) -> None:
         """Redraws pixmap upon window resize."""
         super().resizeEvent(event)
+        self.preloader.set_target_height(
+            round(self.image_label.height() * self.devicePixelRatioF())
+        )
         self.display_current_page()
 
     def set_one_page(self) -> None:
@@ -1147,12 +1454,15 @@ class SimpleReader(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """
-        Emits the closed signal when the reader is closed.
+        Emits the closed signal when the reader is closed, once any running
+        page loads have finished and the archive is closed.
 
         This is used by the reading controller for memory and resource
         management.
         """
         self.preloader.pool.clear()
+        self.preloader.pool.waitForDone()
+        self.comic.close()
         self.closed.emit(self.comic.id, self.sequence.position_to_archive_index())
         super().closeEvent(event)
 
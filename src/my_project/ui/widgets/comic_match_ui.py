@@ -22,12 +22,6 @@ from PySide6.QtWidgets import (
 from my_project.tagging.comic_match_logic import ComicMatch
 from my_project.tagging.tagging_controller import RequestData
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class ComicMatcherUI(QDialog):
     def __init__(
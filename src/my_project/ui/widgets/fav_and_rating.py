@@ -4,6 +4,7 @@ A collection of widgets for user interactivity with the comics.
 Includes a favourite button shaped as a heart, and a rating system with stars.
 """
 
+import functools
 import os
 from pathlib import Path
 
@@ -19,6 +20,28 @@ if not resources_path:
 IMAGES = Path(resources_path)
 
 
+@functools.lru_cache(maxsize=8)
+def _star_pixmaps(width: int, height: int) -> tuple[QPixmap, QPixmap, QPixmap]:
+    """
+    Renders the star images at the size they are shown, once per size, so every
+    StarRating of that size shares the same pixmaps and nothing is rescaled when
+    the stars are painted. This can only be called once the QApplication exists.
+
+    Args:
+        width (int): The width of one star.
+        height (int): The height of one star.
+
+    Returns:
+        tuple[QPixmap, QPixmap, QPixmap]: The full, half and empty star.
+    """
+    size = QSize(width, height)
+    return (
+        QIcon(str(IMAGES / "star_filled.svg")).pixmap(size),
+        QIcon(str(IMAGES / "star_half.svg")).pixmap(size),
+        QIcon(str(IMAGES / "star_outline.svg")).pixmap(size),
+    )
+
+
 class HeartButton(QPushButton):
     """
     A heart shaped button for the user to show that the comic is a favourite.
@@ -85,9 +108,9 @@ class StarRating(QWidget):
         self.stars: list[QLabel] = []
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-        self.full_star = QPixmap(str(IMAGES / "star_filled.svg"))
-        self.half_star = QPixmap(str(IMAGES / "star_half.svg"))
-        self.empty_star = QPixmap(str(IMAGES / "star_outline.svg"))
+        self.full_star, self.half_star, self.empty_star = _star_pixmaps(
+            self.base_width, self.base_height
+        )
 
         layout = QHBoxLayout(self)
         self.spacing = 2
@@ -97,7 +120,6 @@ class StarRating(QWidget):
         for _ in range(5):
             label = QLabel()
             label.setFixedSize(self.base_width, self.base_height)
-            label.setScaledContents(True)
             self.stars.append(label)
             layout.addWidget(label)
 
@@ -19,12 +19,6 @@ from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 from my_project.classes.helper_classes import GUIComicInfo, RSSComicInfo
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class GeneralComicWidget(QWidget):
     left_clicked = Signal(object)
@@ -3,14 +3,16 @@ A user-oriented panel for displaying comic metadata and user interactions
 such as reviews, comments and rating.
 """
 
+import functools
+import logging
 import os
 import re
 from pathlib import Path
-from textwrap import dedent
+from typing import Optional
 
 from dotenv import load_dotenv
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QCloseEvent, QPixmap
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal, Slot
+from PySide6.QtGui import QCloseEvent, QImage, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QGridLayout,
     QGroupBox,
@@ -46,6 +48,9 @@ QLabel {
     font-size: 14px;
 }"""
 
+# A blank line between paragraphs of a description.
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
 
 class DashboardBox(QGroupBox):
     """
@@ -150,6 +155,80 @@ class RoleBox(QGroupBox):
         self.setLayout(layout)
 
 
+class ThumbnailResult(QObject):
+    """
+    Carries a thumbnail decoded on a worker thread back to the GUI thread. It is
+    kept alive by its worker rather than parented to the dialog, so closing the
+    dialog can't delete it while the worker still emits through it.
+    """
+
+    finished = Signal(QImage)
+
+
+class ThumbnailWorker(QRunnable):
+    """
+    Reads and decodes a cover thumbnail off the GUI thread. Only a QImage is made
+    here, as QPixmaps can only be created on the GUI thread.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__()
+        self.path = path
+        self.result = ThumbnailResult()
+
+    @Slot()
+    def run(self) -> None:
+        self.result.finished.emit(QImage(str(self.path)))
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_metadata(primary_id: str) -> MetadataInfo:
+    """
+    Fetches a comic's complete metadata, reusing the result when the dialog is
+    opened again for the same comic. The dialog clears the cache whenever it
+    saves changes to the database.
+
+    Args:
+        primary_id (str): The unique ID of the comic.
+
+    Returns:
+        MetadataInfo: The complete metadata for the comic.
+    """
+    with RepoWorker() as info_getter:
+        return info_getter.get_complete_metadata(primary_id)
+
+
+class MetadataResult(QObject):
+    """
+    Carries the metadata fetched on a worker thread back to the GUI thread. Like
+    ThumbnailResult, it is kept alive by its worker.
+    """
+
+    finished = Signal(MetadataInfo)
+    error = Signal(str)
+
+
+class MetadataWorker(QRunnable):
+    """
+    Fetches a comic's complete metadata off the GUI thread. The database
+    connection is opened and closed on the worker thread.
+    """
+
+    def __init__(self, primary_id: str) -> None:
+        super().__init__()
+        self.primary_id = primary_id
+        self.result = MetadataResult()
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            metadata = _fetch_metadata(self.primary_id)
+        except Exception as e:
+            self.result.error.emit(str(e))
+            return
+        self.result.finished.emit(metadata)
+
+
 class MetadataDialog(QMainWindow):
     """
     A dialog window for displaying comic metadata information.
@@ -165,18 +244,61 @@ class MetadataDialog(QMainWindow):
         This dialog shows metadata fields for a given comic reader instance
         and provides a close button for user interaction.
         """
+        super().__init__()
         self.primary_id = comic_data.primary_id
         self.coverpath = comic_data.cover_path
         self.filepath = comic_data.filepath
-        with RepoWorker() as info_getter:
-            metadata = info_getter.get_complete_metadata(self.primary_id)
-        super().__init__()
-        self.setWindowTitle(f"Metadata for {metadata.title}: {metadata.series}")
+        self.loaded = False
+        self._repo: Optional[RepoWorker] = None
+        self.setWindowTitle(f"Metadata for {comic_data.title}")
         self.setMinimumSize(800, 600)
+
+        self.loading_label = QLabel("Loading…")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setCentralWidget(self.loading_label)
+
+        self.thumbnail_label = QLabel()
+        self.thumbnail_label.setScaledContents(False)
+        self.load_thumbnail()
+
+        # The database is queried on a worker thread so the window opens at once.
+        worker = MetadataWorker(self.primary_id)
+        worker.result.finished.connect(self.populate)
+        worker.result.error.connect(self.on_metadata_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(MetadataInfo)
+    def populate(self, metadata: MetadataInfo) -> None:
+        """
+        Fills the dialog with the comic's metadata once it has been fetched.
+
+        Args:
+            metadata (MetadataInfo): The complete metadata for the comic.
+        """
+        # The dialog is already showing, so hold off repainting until it is built.
+        self.setUpdatesEnabled(False)
+        try:
+            self.build_contents(metadata)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.loaded = True
+
+    def build_contents(self, metadata: MetadataInfo) -> None:
+        """
+        Creates all the dialog's widgets from the comic's metadata and makes them
+        the central widget.
+
+        Args:
+            metadata (MetadataInfo): The complete metadata for the comic.
+        """
+        self.setWindowTitle(f"Metadata for {metadata.title}: {metadata.series}")
         self.name = f"{metadata.series}: {metadata.title}"
 
-        main_layout = QVBoxLayout()
-        content_layout = QGridLayout()
+        # Layouts are given their widget on construction rather than via setLayout.
+        container = QWidget()
+        main_layout = QVBoxLayout(container)
+        content_widget = QWidget()
+        content_layout = QGridLayout(content_widget)
 
         creators_box = DashboardBox("Creators")
         for role, people in metadata.creators:
@@ -186,33 +308,32 @@ class MetadataDialog(QMainWindow):
             creators_box.add_role_box(box)
 
         description_box = DashboardBox("Description", True)
-        clean_desc = re.sub(r"\n\s*\n", "<br><br>", metadata.description).strip()
+        clean_desc = PARAGRAPH_BREAK.sub("<br><br>", metadata.description).strip()
         description_box.add_content(clean_desc)
 
         review_container = QWidget()
         review_layout = QVBoxLayout(review_container)
-        review_container.setLayout(review_layout)
         button_container = QWidget()
-        button_layout = QHBoxLayout()
-        button_container.setLayout(button_layout)
+        button_layout = QHBoxLayout(button_container)
         current_review = QWidget()
-        current_review_layout = QVBoxLayout()
-        current_review.setLayout(current_review_layout)
+        current_review_layout = QVBoxLayout(current_review)
         self.text_edit = QTextEdit()
         review_area = QScrollArea()
         review_area.setStyleSheet("QScrollArea { border: none; }")
         self.text_edit.setPlaceholderText("Write your review here...")
-        if len(metadata.reviews) != 0:
-            for r in metadata.reviews:
-                if not r.review:
-                    continue
-                preset_text = dedent(
-                    f"""
-                    <u>Review No. {r.iteration} Date: {r.date}</u><br>
-                    {r.review}<br><br>
-                """
-                )
-                review_layout.addWidget(QLabel(preset_text))
+        # All past reviews go in one label rather than a label each.
+        review_parts = []
+        for r in metadata.reviews:
+            if not r.review:
+                continue
+            review_parts.append(
+                f"<u>Review No. {r.iteration} Date: {r.date}</u><br>{r.review}<br><br>"
+            )
+        if review_parts:
+            past_reviews = QLabel("".join(review_parts))
+            past_reviews.setTextFormat(Qt.TextFormat.RichText)
+            past_reviews.setWordWrap(True)
+            review_layout.addWidget(past_reviews)
 
         save_button = QPushButton("Save")
         undo_button = QPushButton("Undo")
@@ -228,16 +349,9 @@ class MetadataDialog(QMainWindow):
         review_panel = DashboardBox("Reviews", wrap=False)
         review_panel.add_content(review_area)
 
-        thumbnail_filename = f"{self.primary_id}_t.jpg"
-        thumbnail_pix = QPixmap(ROOT_DIR / ".covers" / thumbnail_filename)
-        thumbnail_label = QLabel()
-        thumbnail_label.setPixmap(thumbnail_pix)
-        thumbnail_label.setScaledContents(False)
-        thumbnail_label.adjustSize()
-        title_cover_box = QVBoxLayout()
         title_cover_widget = QWidget()
-        title_cover_widget.setLayout(title_cover_box)
-        title_cover_box.addWidget(thumbnail_label)
+        title_cover_box = QVBoxLayout(title_cover_widget)
+        title_cover_box.addWidget(self.thumbnail_label)
 
         title_cover_box.addWidget(self.create_overview_widget(metadata))
         overview_panel = DashboardBox("Overview", wrap=False)
@@ -251,23 +365,80 @@ class MetadataDialog(QMainWindow):
         close_button = QPushButton("Close")
         close_button.clicked.connect(self.close)
 
-        content_widget = QWidget()
-        content_widget.setLayout(content_layout)
-
         main_layout.addWidget(content_widget)
         main_layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignRight)
 
-        container = QWidget()
-        container.setLayout(main_layout)
         self.setCentralWidget(container)
 
+    @Slot(str)
+    def on_metadata_failed(self, message: str) -> None:
+        """
+        Shows that the metadata could not be loaded.
+
+        Args:
+            message (str): The error raised while fetching the metadata.
+        """
+        logging.error("Failed to load metadata for %s: %s", self.primary_id, message)
+        self.loading_label.setText("Could not load the metadata for this comic.")
+
+    def load_thumbnail(self) -> None:
+        """
+        Shows the comic's thumbnail, reusing the copy in the pixmap cache if this
+        or another dialog has already loaded it. Otherwise the image is read and
+        decoded on a worker thread and shown once it is ready.
+        """
+        thumbnail_pix = QPixmapCache.find(self.primary_id)
+        if thumbnail_pix is not None:
+            self.show_thumbnail(thumbnail_pix)
+            return
+
+        thumbnail_filename = f"{self.primary_id}_t.jpg"
+        worker = ThumbnailWorker(ROOT_DIR / ".covers" / thumbnail_filename)
+        worker.result.finished.connect(self.on_thumbnail_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(QImage)
+    def on_thumbnail_loaded(self, image: QImage) -> None:
+        """
+        Converts the decoded thumbnail into a pixmap, caches it and shows it.
+
+        Args:
+            image (QImage): The thumbnail decoded by the worker thread.
+        """
+        if image.isNull():
+            return
+        thumbnail_pix = QPixmap.fromImage(image)
+        QPixmapCache.insert(self.primary_id, thumbnail_pix)
+        self.show_thumbnail(thumbnail_pix)
+
+    def show_thumbnail(self, thumbnail_pix: QPixmap) -> None:
+        """Puts the thumbnail in its label."""
+        self.thumbnail_label.setPixmap(thumbnail_pix)
+        self.thumbnail_label.adjustSize()
+
+    def repo(self) -> RepoWorker:
+        """
+        Gives the dialog's database connection, opening it the first time it is
+        needed. It stays open until the dialog is closed so saving reviews does
+        not reconnect each time.
+
+        Returns:
+            RepoWorker: The open worker for this dialog.
+        """
+        if self._repo is None:
+            self._repo = RepoWorker().open()
+        return self._repo
+
     def save_current_review(self) -> None:
         """Saves the currently written review to the database."""
         current_text = self.text_edit.toPlainText()
-        with RepoWorker() as review_saver:
-            review_saver.input_review_column(
-                primary_key=self.primary_id, review_text=current_text
-            )
+        review_saver = self.repo()
+        review_saver.input_review_column(
+            primary_key=self.primary_id, review_text=current_text
+        )
+        # Commit straight away so the write lock is not held while the dialog is open.
+        review_saver.conn.commit()
+        _fetch_metadata.cache_clear()
         return None
 
     def create_overview_widget(self, metadata_model: MetadataInfo) -> QWidget:
@@ -336,11 +507,18 @@ class MetadataDialog(QMainWindow):
         favourite status.
         TODO: Add review saving here also - or ask the user.
         """
-        favourite_state = self.heart.isChecked()
-        rating = int(self.stars.rating * 2)
-        with RepoWorker() as worker:
+        if self.loaded:
+            favourite_state = self.heart.isChecked()
+            rating = int(self.stars.rating * 2)
+            worker = self.repo()
             worker.favourite_toggle(self.primary_id, favourite_state)
             worker.save_rating(self.primary_id, rating)
+        if self._repo is not None:
+            # Commits the changes above and closes the connection.
+            self._repo.close()
+            self._repo = None
+            # Cleared only once committed, so a refetch can't cache the old values.
+            _fetch_metadata.cache_clear()
         return super().closeEvent(event)
 
 
@@ -390,7 +568,7 @@ class MetadataPanel(QWidget):
         layout.addWidget(title_widget)
 
         formatted_desc = comic_metadata.description or ""
-        clean_desc = re.sub(r"\s+", " ", formatted_desc).strip()
+        clean_desc = " ".join(formatted_desc.split())
         desc_widget = QLabel(clean_desc)
         desc_widget.setWordWrap(True)
         desc_widget.setSizePolicy(
@@ -2,8 +2,10 @@
 Creates the assets for the reading progress bar.
 """
 
+from typing import Optional
+
 from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtGui import QBrush, QColor, QPainter, QPixmap
 from PySide6.QtWidgets import QWidget
 
 
@@ -15,6 +17,10 @@ class CoverWithProgress(QWidget):
     at the bottom signifying the reading progress.
     """
 
+    # Shared by every repaint instead of being created each time.
+    TRACK_BRUSH = QBrush(QColor(80, 80, 80, 180))
+    PROGRESS_BRUSH = QBrush(QColor(0, 200, 0, 200))
+
     def __init__(self, image_path: str, progress: float, parent=None):
         """
         Intialises the cover image widget.
@@ -27,6 +33,7 @@ class CoverWithProgress(QWidget):
         super().__init__(parent)
         self.pixmap = QPixmap(image_path)
         self.progress = progress
+        self._scaled: Optional[QPixmap] = None
 
         self.setMinimumSize(250, 400)
         self.setMaximumSize(250, 400)
@@ -42,23 +49,45 @@ class CoverWithProgress(QWidget):
         self.progress = max(0.0, min(1.0, value))
         self.update()
 
+    def resizeEvent(self, event):
+        """Drops the scaled cover so it is scaled again to the new size."""
+        self._scaled = None
+        super().resizeEvent(event)
+
+    def scaled_pixmap(self) -> QPixmap:
+        """
+        Gives the cover scaled to fill the widget, scaling it only when the widget's
+        size or pixel ratio has changed rather than on every repaint.
+
+        Returns:
+            QPixmap: The cover at the widget's size in device pixels.
+        """
+        ratio = self.devicePixelRatioF()
+        if self._scaled is None or self._scaled.devicePixelRatio() != ratio:
+            self._scaled = self.pixmap.scaled(
+                self.size() * ratio,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            self._scaled.setDevicePixelRatio(ratio)
+        return self._scaled
+
     def paintEvent(self, event):
         """
         Paints over the comic cover image with a green bar at the bottom
         which represents the reading progress.
         """
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        painter.drawPixmap(self.rect(), self.pixmap)
+        painter.drawPixmap(0, 0, self.scaled_pixmap())
 
         bar_height = 10
         bar_width = int(self.width() * self.progress)
         bar_rect = QRect(0, self.height() - bar_height, bar_width, bar_height)
 
-        painter.setBrush(QColor(80, 80, 80, 180))
+        painter.setBrush(self.TRACK_BRUSH)
         painter.setPen(Qt.NoPen)  # type: ignore
         painter.drawRect(0, self.height() - bar_height, self.width(), bar_height)
 
-        painter.setBrush(QColor(0, 200, 0, 200))
+        painter.setBrush(self.PROGRESS_BRUSH)
         painter.drawRect(bar_rect)
@@ -9,12 +9,6 @@ from PySide6.QtWidgets import QMenu
 from my_project.classes.helper_classes import GUIComicInfo
 from my_project.database.gui_repo_worker import RepoWorker
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 
 class GridViewContextMenuManager:
     """
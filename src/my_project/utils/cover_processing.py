@@ -9,25 +9,29 @@ from typing import Optional
 import Levenshtein
 from PIL import Image
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+COVER_CUES = re.compile(r"\b(?:cover|front|fc)\b", re.IGNORECASE)
+NUMBERS = re.compile(r"\d+")
 
 
 class ImageExtraction:
-    def __init__(self, path: Path, output_dir: Path, primary_key: str) -> None:
+    def __init__(
+        self,
+        path: Path,
+        output_dir: Path,
+        primary_key: str,
+        image_names: Optional[list[str]] = None,
+    ) -> None:
         self.filepath = path
         self.output_folder = output_dir
         self.primary_key = primary_key
-        self.image_names: list[str] = self.get_namelist()
+        # Callers that have already listed the archive can pass its images in.
+        self.image_names: list[str] = (
+            list(image_names) if image_names is not None else self.get_namelist()
+        )
         self.cover_bytes: Optional[bytes] = None
 
     @staticmethod
     def score(name: str) -> tuple[int, int, str]:
-        COVER_CUES = re.compile(r"\b(?:cover|front|fc)\b", re.IGNORECASE)
-        NUMBERS = re.compile(r"\d+")
         stem = Path(name)
         lowered = str(stem).lower()
 
@@ -40,7 +44,8 @@ class ImageExtraction:
                 return (1, num, name)
 
         if numbers:
-            return (2 + min(numbers), min(numbers), name)
+            lowest = min(numbers)
+            return (2 + lowest, lowest, name)
 
         return (10, 0, name)
 
@@ -61,10 +66,7 @@ class ImageExtraction:
         if not self.image_names:
             raise ValueError("Empty file list")
 
-        ranked: list[tuple[int, int, str]] = sorted(
-            self.score(f) for f in self.image_names
-        )
-        return ranked[0][-1]
+        return min(self.score(f) for f in self.image_names)[-1]
 
     def extract_image_bytes(self) -> None:
         cover_file_name = self.choose_cover()
@@ -149,7 +151,9 @@ class ImageExtraction:
 
     def run(self):
         try:
-            self.extract_image_bytes()
+            # The cover may already have been read by the caller.
+            if self.cover_bytes is None:
+                self.extract_image_bytes()
             self.save_cover()
             logging.info("Cover saved!")
         except Exception as e:
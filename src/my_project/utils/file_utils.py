@@ -5,11 +5,7 @@ import uuid
 import zipfile
 from pathlib import Path
 
-logging.basicConfig(
-    filename="debug.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+COMIC_ARCHIVES = (".cbz", ".cbr")
 
 
 def convert_cbz(cbr_path: Path, *, delete_original: bool = True) -> Path:
@@ -61,7 +57,7 @@ def convert_cbz(cbr_path: Path, *, delete_original: bool = True) -> Path:
     if delete_original:
         cbr_path.unlink()
 
-    logging.info(f"Converted: {cbr_path.name} --> {cbz_path.name}")
+    logging.info("Converted: %s --> %s", cbr_path.name, cbz_path.name)
     return cbz_path
 
 
@@ -69,8 +65,7 @@ def is_comic(path: Path) -> bool:
     """
     Tells whether a file is a comic archive or not.
     """
-    comic_archives = [".cbz", ".cbr"]
-    return path.suffix.lower() in comic_archives
+    return path.suffix.lower() in COMIC_ARCHIVES
 
 
 def get_name(path: Path) -> str:
@@ -0,0 +1,50 @@
+import atexit
+import logging
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FILE = "debug.log"
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+# Records are written to the file in batches of this size, or at once for errors.
+LOG_BATCH_SIZE = 100
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Sends log records from the root logger through a queue to a background
+    thread that writes them to debug.log, so logging calls on the tagging path
+    only enqueue the record instead of blocking on a file write. The listener
+    buffers records and writes them in batches; an error flushes the buffer
+    straight away so it is never lost behind buffered records.
+
+    This is called from entry points rather than on import. Only the first call
+    configures logging, and nothing is changed if the root logger already has
+    handlers.
+
+    Args:
+        level (int): The level of the root logger.
+    """
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None or root.hasHandlers():
+        return
+
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffered_handler = MemoryHandler(
+        LOG_BATCH_SIZE, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+    _listener.start()
+    # At exit, stop the listener so queued records reach the buffer, then close
+    # the buffer so they are written. atexit runs these in reverse order.
+    atexit.register(buffered_handler.close)
+    atexit.register(_listener.stop)
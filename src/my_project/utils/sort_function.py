@@ -44,7 +44,8 @@ def score(name: str) -> tuple[int, int, str]:
             return (1, num, name)
 
     if numbers:
-        return (2 + min(numbers), min(numbers), name)
+        lowest = min(numbers)
+        return (2 + lowest, lowest, name)
 
     return (10, 0, name)
 
@@ -69,8 +70,7 @@ def choose_cover(files: list[str]) -> str:
     if not files:
         raise ValueError("Empty file list")
 
-    ranked: list[tuple[int, int, str]] = sorted(score(f) for f in files)
-    return ranked[0][-1]
+    return min(score(f) for f in files)[-1]
 
 
 def sort_by_cover_likelihood(files: list[str]) -> list[str]:
@@ -0,0 +1,47 @@
+import sqlite3
+from pathlib import Path
+
+from my_project.classes.helper_classes import ComicInfo
+from my_project.database.db_input import MetadataInputting
+
+
+def make_inputter():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE characters (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"
+    )
+    conn.execute("INSERT INTO characters (name) VALUES ('Batman')")
+    conn.commit()
+    info = ComicInfo(primary_key="abc", filepath=Path("Batman 001.cbz"))
+    return MetadataInputting(info, 20, conn)
+
+
+def test_insert_names_finds_existing_and_adds_new():
+    inputter = make_inputter()
+    batman_id = inputter.conn.execute(
+        "SELECT id FROM characters WHERE name = 'Batman'"
+    ).fetchone()[0]
+
+    ids = inputter.insert_names("characters", "name", ["Batman", "Robin", "Robin"])
+
+    assert set(ids) == {"Batman", "Robin"}
+    assert ids["Batman"] == batman_id
+    rows = inputter.conn.execute("SELECT name, id FROM characters").fetchall()
+    assert dict(rows) == ids
+
+
+def test_insert_names_with_no_names():
+    inputter = make_inputter()
+
+    assert inputter.insert_names("characters", "name", []) == {}
+    assert inputter.conn.execute("SELECT COUNT(*) FROM characters").fetchone() == (1,)
+
+
+def test_shared_connection_is_not_committed():
+    inputter = make_inputter()
+    inputter.insert_names("characters", "name", ["Robin"])
+    inputter.commit()
+    inputter.conn.rollback()
+
+    names = inputter.conn.execute("SELECT name FROM characters").fetchall()
+    assert names == [("Batman",)]
@@ -1,6 +1,9 @@
 from types import SimpleNamespace
 
-from my_project.tagging.metadata_cleaning import MetadataProcessing
+import pytest
+
+from my_project.tagging import metadata_cleaning
+from my_project.tagging.metadata_cleaning import MetadataProcessing, PublisherNotKnown
 
 
 class MockParser:
@@ -145,3 +148,77 @@ def test_title_case_applied():
 
     assert result["title"] == "The Dark Phoenix Saga"
     assert result["series"] == "Uncanny X-Men"
+
+
+KNOWN_PUBLISHERS = [
+    (1, "Marvel Comics", "marvel"),
+    (2, "DC Comics", "dc"),
+    (3, "Image Comics", "image"),
+]
+
+
+@pytest.fixture
+def known_publishers(monkeypatch):
+    monkeypatch.setattr(
+        metadata_cleaning, "get_publisher_info", lambda: KNOWN_PUBLISHERS
+    )
+    metadata_cleaning.clear_publisher_cache()
+    yield KNOWN_PUBLISHERS
+    metadata_cleaning.clear_publisher_cache()
+
+
+def test_match_publisher(known_publishers):
+    raw_info = SimpleNamespace(publisher="DC Comics", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+
+    assert proc.match_publisher() == (2, "DC Comics")
+
+
+def test_match_publisher_fuzzy(known_publishers):
+    raw_info = SimpleNamespace(publisher="DC Entertainment", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+
+    assert proc.match_publisher() == (2, "DC Comics")
+
+
+def test_match_publisher_unknown(known_publishers):
+    raw_info = SimpleNamespace(publisher="Boom! Studios", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+
+    with pytest.raises(PublisherNotKnown):
+        proc.match_publisher()
+
+
+def test_is_known_publisher(known_publishers):
+    assert MetadataProcessing.is_known_publisher("Marvel Comics")
+    assert not MetadataProcessing.is_known_publisher("Boom! Studios")
+
+
+def test_volume_num_from_filename():
+    raw_info = SimpleNamespace(original_filename="Saga v03 (2014)", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+    assert proc.extract_volume_num_from_filename() == (3, 0)
+
+    raw_info = SimpleNamespace(original_filename="Saga Volume 4 (2015)", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+    assert proc.extract_volume_num_from_filename() == (4, 0)
+
+
+def test_marked_volume_beats_bare_number():
+    raw_info = SimpleNamespace(original_filename="Batman 100 v2 (2016)", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+    assert proc.extract_volume_num_from_filename() == (2, 0)
+
+    raw_info = SimpleNamespace(original_filename="Batman 100 (2016)", filepath="")
+    proc = MetadataProcessing(raw_info)  # type: ignore[arg-type]
+    assert proc.extract_volume_num_from_filename() == (100, 0)
+
+
+def test_title_case_minor_words_and_hyphens():
+    assert MetadataProcessing.title_case("the man-of-war in the sky") == (
+        "The Man-of-War in the Sky"
+    )
+    assert MetadataProcessing.title_case("of mice and men") == "Of Mice and Men"
+    assert MetadataProcessing.title_case("spider-man's  2nd day") == (
+        "Spider-Man's 2nd Day"
+    )
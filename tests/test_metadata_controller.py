@@ -0,0 +1,273 @@
+import errno
+import os
+import sqlite3
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+
+from my_project.tagging import metadata_cleaning, metadata_controller
+from my_project.tagging.metadata_cleaning import MetadataProcessing
+from my_project.tagging.metadata_controller import (
+    MetadataController,
+    _comic_savepoint,
+    _commit_and_move,
+)
+
+
+def make_conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE comics (id TEXT)")
+    conn.commit()
+    return conn
+
+
+def test_savepoint_keeps_batch_open():
+    conn = make_conn()
+    with _comic_savepoint(conn):
+        conn.execute("INSERT INTO comics VALUES ('a')")
+
+    assert conn.in_transaction
+    conn.rollback()
+    assert conn.execute("SELECT id FROM comics").fetchall() == []
+
+
+def test_failed_comic_leaves_no_rows():
+    conn = make_conn()
+    with _comic_savepoint(conn):
+        conn.execute("INSERT INTO comics VALUES ('a')")
+    with pytest.raises(ValueError):
+        with _comic_savepoint(conn):
+            conn.execute("INSERT INTO comics VALUES ('b')")
+            raise ValueError("insert failed")
+    conn.commit()
+
+    assert conn.execute("SELECT id FROM comics").fetchall() == [("a",)]
+
+
+def test_comics_are_moved_after_their_rows_commit(tmp_path):
+    conn = make_conn()
+    moves = []
+
+    class MovedComic(MetadataController):
+        def move_to_publisher_folder(self, new_name, publisher_int):
+            committed = conn.execute("SELECT id FROM comics").fetchall()
+            moves.append((new_name, publisher_int, conn.in_transaction, committed))
+
+    comic = MovedComic("abc", tmp_path / "comic.cbz", None)
+    comic.destination = ("Batman 001.cbz", 2)
+    pending: list[MetadataController] = [comic]
+    with _comic_savepoint(conn):
+        conn.execute("INSERT INTO comics VALUES ('abc')")
+
+    _commit_and_move(conn, pending)
+
+    assert moves == [("Batman 001.cbz", 2, False, [("abc",)])]
+    assert pending == []
+
+
+def test_failed_comic_forgets_new_publisher(tmp_path, monkeypatch):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE publishers (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " name TEXT, normalised_name TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO publishers (name, normalised_name) VALUES ('Marvel', 'marvel')"
+    )
+    conn.commit()
+    monkeypatch.setattr(
+        metadata_cleaning,
+        "get_publisher_info",
+        lambda: conn.execute(
+            "SELECT id, name, normalised_name FROM publishers"
+        ).fetchall(),
+    )
+    metadata_cleaning.clear_publisher_cache()
+    controller = MetadataController("abc", tmp_path / "comic.cbz", None)
+    controller.conn = conn
+    raw_info = SimpleNamespace(publisher="Boom! Studios")
+
+    with pytest.raises(ValueError):
+        with _comic_savepoint(conn):
+            controller.ensure_publisher_known(raw_info)  # type: ignore[arg-type]
+            assert MetadataProcessing.is_known_publisher("Boom! Studios")
+            raise ValueError("insert failed")
+
+    assert not MetadataProcessing.is_known_publisher("Boom! Studios")
+    metadata_cleaning.clear_publisher_cache()
+
+
+COMPLETE_XML = b"""<?xml version="1.0"?>
+<ComicInfo>
+  <Title>Rebirth</Title>
+  <Series>Batman</Series>
+  <Year>2016</Year>
+  <Number>1</Number>
+  <Writer>Tom King</Writer>
+  <Penciller>David Finch</Penciller>
+  <Summary>Gotham needs a hero.</Summary>
+</ComicInfo>
+"""
+
+
+def make_comic(tmp_path, files):
+    path = tmp_path / "Batman 001 (2016).cbz"
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return MetadataController("abc", path, None)
+
+
+def test_complete_comicinfo_is_read(tmp_path):
+    controller = make_comic(
+        tmp_path,
+        {
+            "p1.jpg": b"x",
+            "p2.PNG": b"x",
+            "notes.txt": b"x",
+            "ComicInfo.xml": COMPLETE_XML,
+        },
+    )
+
+    root = controller.has_metadata()
+
+    assert root is not None
+    assert root.findtext("Series") == "Batman"
+    assert controller.page_count == 2
+    assert controller._has_comicinfo
+
+
+def test_blank_tag_counts_as_missing(tmp_path):
+    xml = COMPLETE_XML.replace(
+        b"<Summary>Gotham needs a hero.</Summary>", b"<Summary>  </Summary>"
+    )
+    controller = make_comic(tmp_path, {"p1.jpg": b"x", "ComicInfo.xml": xml})
+
+    assert controller.has_metadata() is None
+    assert controller._has_comicinfo
+
+
+def test_missing_tag_is_rejected(tmp_path):
+    xml = COMPLETE_XML.replace(b"<Writer>Tom King</Writer>", b"")
+    controller = make_comic(tmp_path, {"p1.jpg": b"x", "ComicInfo.xml": xml})
+
+    assert controller.has_metadata() is None
+
+
+def test_oversized_comicinfo_is_not_read(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_controller, "MAX_COMICINFO_SIZE", 64)
+    controller = make_comic(tmp_path, {"p1.jpg": b"x", "ComicInfo.xml": COMPLETE_XML})
+
+    assert controller.has_metadata() is None
+    assert controller._has_comicinfo
+    assert controller._comicinfo_bytes is None
+
+
+def test_only_top_level_comicinfo_counts(tmp_path):
+    controller = make_comic(
+        tmp_path, {"p1.jpg": b"x", "extras/ComicInfo.xml": COMPLETE_XML}
+    )
+
+    assert controller.has_metadata() is None
+    assert not controller._has_comicinfo
+    assert controller.page_count == 1
+
+
+@pytest.fixture
+def publisher_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_controller, "ROOT_DIR", tmp_path)
+    (tmp_path / "2 - DC Comics").mkdir()
+    metadata_controller._publisher_folders.cache_clear()
+    yield tmp_path
+    metadata_controller._publisher_folders.cache_clear()
+
+
+def make_download(root):
+    path = root / "Batman 001 (2016).cbz"
+    path.write_bytes(b"new")
+    controller = MetadataController("abc", path, None)
+    controller.inputter = SimpleNamespace(
+        insert_filepath=lambda path: None, close=lambda: None
+    )
+    return controller
+
+
+def test_move_does_not_overwrite_existing_comic(publisher_root):
+    existing = publisher_root / "2 - DC Comics" / "Batman 001.cbz"
+    existing.write_bytes(b"old")
+    controller = make_download(publisher_root)
+
+    controller.move_to_publisher_folder("Batman 001.cbz", 2)
+
+    assert existing.read_bytes() == b"old"
+    assert controller.filepath.exists()
+
+
+def test_move_copies_across_drives(publisher_root, monkeypatch):
+    def rename(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", rename)
+    controller = make_download(publisher_root)
+
+    controller.move_to_publisher_folder("Batman 001.cbz", 2)
+
+    assert (publisher_root / "2 - DC Comics" / "Batman 001.cbz").read_bytes() == b"new"
+    assert not controller.filepath.exists()
+
+
+def test_move_only_copies_across_drives(publisher_root, monkeypatch):
+    def rename(src, dst):
+        raise PermissionError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(os, "rename", rename)
+    controller = make_download(publisher_root)
+
+    with pytest.raises(PermissionError):
+        controller.move_to_publisher_folder("Batman 001.cbz", 2)
+    assert controller.filepath.exists()
+
+
+def test_zip_cbr_is_renamed(tmp_path):
+    path = tmp_path / "Batman 001.cbr"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("p1.jpg", b"x")
+    controller = MetadataController("abc", path, None)
+
+    controller.reformat()
+
+    assert controller.filepath == path.with_suffix(".cbz")
+    assert zipfile.is_zipfile(controller.filepath)
+    assert not path.exists()
+
+
+def test_zip_cbr_does_not_replace_existing_cbz(tmp_path):
+    path = tmp_path / "Batman 001.cbr"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("p1.jpg", b"x")
+    existing = path.with_suffix(".cbz")
+    existing.write_bytes(b"old")
+    controller = MetadataController("abc", path, None)
+
+    with pytest.raises(FileExistsError):
+        controller.reformat()
+    assert existing.read_bytes() == b"old"
+    assert path.exists()
+
+
+def test_create_name(tmp_path):
+    controller = MetadataController("abc", tmp_path / "comic.cbz", None)
+    clean = SimpleNamespace(
+        month=3,
+        year=2016,
+        volume_num=2,
+        collection_type=4,
+        series="Amazing Spider-Man",
+        title="Coming Home?",
+        publisher_id=1,
+    )
+
+    name = controller.create_name(clean)  # type: ignore[arg-type]
+
+    assert name == ("Amazing Spider-Man - Coming Home- MEC #02 (Mar 2016).cbz", 1)
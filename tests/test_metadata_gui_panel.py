@@ -0,0 +1,41 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from my_project.classes.helper_classes import GUIComicInfo
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("FRONTEND_RESOURCES", str(Path(__file__).parent))
+panel = pytest.importorskip("my_project.ui.widgets.metadata_gui_panel")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def test_worker_outlives_deleted_dialog(tmp_path, monkeypatch, capfd):
+    import shiboken6
+    from PySide6.QtCore import QThreadPool
+
+    def slow_fetch(primary_id):
+        time.sleep(0.2)
+        raise LookupError(primary_id)
+
+    monkeypatch.setattr(panel, "_fetch_metadata", slow_fetch)
+    info = GUIComicInfo(
+        primary_id="abc",
+        title="t",
+        filepath=tmp_path / "comic.cbz",
+        cover_path=tmp_path / "cover.jpg",
+    )
+    dialog = panel.MetadataDialog(info)
+
+    shiboken6.delete(dialog)
+    QThreadPool.globalInstance().waitForDone()
+
+    assert "Signal source has been deleted" not in capfd.readouterr().err
@@ -0,0 +1,91 @@
+import logging
+import os
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from my_project.classes.helper_classes import GUIComicInfo
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("FRONTEND_RESOURCES", str(Path(__file__).parent))
+reader = pytest.importorskip("my_project.ui.reader.reader")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def qt_app():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def page(shade):
+    buffer = BytesIO()
+    Image.new("RGB", (60, 90), (shade, 0, 0)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_comic(tmp_path, compression=zipfile.ZIP_STORED, pages=6):
+    path = tmp_path / "comic.cbz"
+    with zipfile.ZipFile(path, "w", compression=compression) as archive:
+        for i in range(pages):
+            archive.writestr(f"p{i:02}.png", page(i * 20))
+            if i == 2:
+                archive.writestr("notes.txt", "x" * 50)
+    info = GUIComicInfo(primary_id="abc", title="t", filepath=path, cover_path=path)
+    return reader.Comic(info)
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_prefetch_range_caches_pages(tmp_path, compression):
+    comic = make_comic(tmp_path, compression)
+
+    comic.prefetch_range(1, 5)
+
+    assert list(comic.cache) == comic.image_names[1:5]
+    for name, data in comic.cache.items():
+        assert data == comic.zip.read(name)
+    comic.close()
+
+
+def test_prefetch_range_is_capped_at_cache_size(tmp_path):
+    comic = make_comic(tmp_path, pages=14)
+
+    comic.prefetch_range(0, 14)
+
+    assert list(comic.cache) == comic.image_names[: comic.max_cache]
+    comic.close()
+
+
+def test_prefetch_range_skips_corrupt_page(tmp_path):
+    comic = make_comic(tmp_path)
+    info = comic.image_infos[3]
+    # Flip a byte near the end of the stored page so its CRC no longer matches.
+    with open(comic.path, "r+b") as file:
+        file.seek(info.header_offset + 30 + len(info.filename) + info.file_size - 1)
+        byte = file.read(1)
+        file.seek(-1, os.SEEK_CUR)
+        file.write(bytes([byte[0] ^ 0xFF]))
+
+    comic.prefetch_range(0, 6)
+
+    assert info.filename not in comic.cache
+    assert len(comic.cache) == 5
+    comic.close()
+
+
+def test_prefetch_range_stops_on_truncated_header(tmp_path, caplog):
+    caplog.set_level(logging.DEBUG)
+    comic = make_comic(tmp_path)
+    # Point the last page's entry at the end of the file, where its local
+    # header would be cut short.
+    last = comic.image_infos[-1]
+    last.header_offset = comic.path.stat().st_size - 10
+
+    comic.prefetch_range(0, 6)
+
+    assert list(comic.cache) == comic.image_names[:5]
+    assert "Stopped prefetching" in caplog.text
+    comic.close()